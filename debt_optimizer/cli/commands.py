@@ -232,8 +232,13 @@ def config_set(ctx, key, value):
 @click.option("--threshold", type=int, help="Fuzzy match threshold (0-100)")
 @click.option("--bank-account", help="Bank account name for Settings sheet")
 @click.option("--no-backup", is_flag=True, help="Skip creating backup file")
+@click.option(
+    "--scorer",
+    type=click.Choice(["wratio", "token_set", "ratio"]),
+    help="Fuzzy matching scorer (default: wratio)",
+)
 @click.pass_context
-def update_balances(ctx, db, xlsx, threshold, bank_account, no_backup):
+def update_balances(ctx, db, xlsx, threshold, bank_account, no_backup, scorer):
     """Update Excel workbook balances from Quicken database.
 
     This command reads account balances from your Quicken database and updates
@@ -249,6 +254,7 @@ def update_balances(ctx, db, xlsx, threshold, bank_account, no_backup):
     fuzzy_threshold = threshold or cfg.get("fuzzy_match_threshold")
     bank_acct_name = bank_account or cfg.get("bank_account_name")
     auto_backup = not no_backup and cfg.get("auto_backup")
+    fuzzy_scorer = scorer or cfg.get("fuzzy_scorer") or "wratio"
 
     try:
         click.echo("📊 Updating balances from Quicken database...")
@@ -262,6 +268,7 @@ def update_balances(ctx, db, xlsx, threshold, bank_account, no_backup):
             fuzzy_threshold=fuzzy_threshold,
             bank_account_name=bank_acct_name,
             auto_backup=auto_backup,
+            scorer=fuzzy_scorer,
         )
 
         # Update workbook
@@ -9,24 +9,32 @@ import shutil
 import sqlite3
 import time
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
+# Prefer rapidfuzz: same scorer API, but the WRatio scan over account
+# names runs in its C++ core instead of thefuzz's Python loop.
 try:
-    from thefuzz import fuzz, process
+    from rapidfuzz import fuzz, process
 
     HAS_FUZZ = True
-    FUZZ_LIBRARY: Optional[str] = "thefuzz"
+    FUZZ_LIBRARY: Optional[str] = "rapidfuzz"
 except ImportError:
     try:
-        from rapidfuzz import fuzz, process
+        from thefuzz import fuzz, process
 
         HAS_FUZZ = True
-        FUZZ_LIBRARY = "rapidfuzz"
+        FUZZ_LIBRARY = "thefuzz"
     except ImportError:
         HAS_FUZZ = False
         FUZZ_LIBRARY = "none"
 
+try:
+    from rapidfuzz.utils import default_process as _default_process
+except ImportError:  # thefuzz applies its own preprocessing internally
+    _default_process = None
+
 import openpyxl
 
 
@@ -45,6 +53,7 @@ class BalanceUpdater:
         fuzzy_threshold: int = 80,
         bank_account_name: str = "PECU Checking",
         auto_backup: bool = True,
+        scorer: str = "wratio",
     ):
         """Initialize balance updater.
 
@@ -53,12 +62,27 @@ class BalanceUpdater:
             fuzzy_threshold: Minimum score for fuzzy matches (0-100)
             bank_account_name: Name of checking account to use for bank balance
             auto_backup: Whether to create backup before updating
+            scorer: Fuzzy scorer name: "wratio" (default, most thorough),
+                "token_set" (cheaper, robust to word reordering) or
+                "ratio" (cheapest, plain edit distance)
         """
         if not HAS_FUZZ:
             raise ImportError(
                 "Fuzzy matching library required for balance updates. "
-                "Install one of: pip install 'thefuzz[speedup]' or pip install rapidfuzz"  # noqa: E501
+                "Install one of: pip install rapidfuzz or pip install 'thefuzz[speedup]'"  # noqa: E501
+            )
+
+        scorers = {
+            "wratio": fuzz.WRatio,
+            "token_set": fuzz.token_set_ratio,
+            "ratio": fuzz.ratio,
+        }
+        if scorer not in scorers:
+            raise ValueError(
+                f"Unknown fuzzy scorer '{scorer}'; expected one of: "
+                f"{', '.join(sorted(scorers))}"
             )
+        self.scorer = scorers[scorer]
 
         self.db_path = Path(db_path)
         self.fuzzy_threshold = fuzzy_threshold
@@ -88,7 +112,16 @@ class BalanceUpdater:
         Returns:
             SQLite connection
         """
-        return sqlite3.connect(f"file:{self.db_path}?mode=ro", uri=True)
+        conn = sqlite3.connect(f"file:{self.db_path}?mode=ro", uri=True)
+        # Read-only workload: keep any sort/temp spill in memory and let
+        # SQLite skip write-path bookkeeping entirely. A 64 MB page cache
+        # and mmap'd I/O keep the account/transaction B-trees hot during
+        # the aggregation query without a read() syscall per page.
+        conn.execute("PRAGMA query_only = 1")
+        conn.execute("PRAGMA temp_store = MEMORY")
+        conn.execute("PRAGMA cache_size = -65536")
+        conn.execute("PRAGMA mmap_size = 268435456")
+        return conn
 
     def load_quicken_balances(
         self,
@@ -108,7 +141,6 @@ class BalanceUpdater:
             Tuple of (accounts_by_name, credit_card_names, checking_names, savings_names)  # noqa: E501
         """
         conn = self.connect_db()
-        conn.row_factory = sqlite3.Row
 
         try:
             cur = conn.cursor()
@@ -116,24 +148,32 @@ class BalanceUpdater:
             # Calculate current Cocoa timestamp (seconds since 2001-01-01)
             cocoa_now = int(time.time() - 978307200)
 
+            # Aggregate the transaction table once per account up front,
+            # instead of re-running a correlated SUM subquery for every
+            # ZACCOUNT row. SUM over no rows is NULL, so accounts without
+            # qualifying transactions still fall back to the ledger balance.
             sql = """
+                WITH tx AS (
+                    SELECT
+                        ZACCOUNT AS acc,
+                        SUM(ZAMOUNT) AS register_balance
+                    FROM ZTRANSACTION
+                    WHERE ZDELETIONCOUNT = 0
+                      AND COALESCE(NULLIF(ZPOSTEDDATE, 0), NULLIF(ZENTEREDDATE, 0), 0) <= ?
+                    GROUP BY ZACCOUNT
+                )
                 SELECT
                     a.Z_PK AS id,
                     a.ZNAME AS name,
                     a.ZTYPENAME AS type,
                     a.ZACTIVE AS active,
                     COALESCE(
-                        (
-                            SELECT SUM(t2.ZAMOUNT)
-                            FROM ZTRANSACTION t2
-                            WHERE t2.ZACCOUNT = a.Z_PK
-                              AND t2.ZDELETIONCOUNT = 0
-                              AND COALESCE(NULLIF(t2.ZPOSTEDDATE, 0), NULLIF(t2.ZENTEREDDATE, 0), 0) <= ?
-                        ),
+                        tx.register_balance,
                         a.ZONLINEBANKINGLEDGERBALANCEAMOUNT,
                         0
                     ) AS balance
                 FROM ZACCOUNT a
+                LEFT JOIN tx ON tx.acc = a.Z_PK
                 WHERE a.ZACTIVE = 1
                   AND a.ZTYPENAME IN ('CREDITCARD','CHECKING','SAVINGS')
             """  # noqa: E501
@@ -141,27 +181,34 @@ class BalanceUpdater:
             rows = cur.fetchall()
 
             accounts_by_name = {}
-            credit_card_names = []
-            checking_names = []
-            savings_names = []
-
-            for r in rows:
-                name = r["name"]
-                acc_type = (r["type"] or "").upper().strip()
-                bal = float(r["balance"] or 0.0)
+            # One dict lookup per row replaces the CREDITCARD/CHECKING/
+            # SAVINGS if/elif chain; unknown types fall into a throwaway
+            # bucket via the .get default.
+            buckets: Dict[str, List[str]] = {
+                "CREDITCARD": [],
+                "CHECKING": [],
+                "SAVINGS": [],
+            }
+            other: List[str] = []
+
+            # Positional unpacking matches the SELECT column order and
+            # skips sqlite3.Row's per-field name lookups.
+            for acc_id, name, acc_type_raw, _active, bal_raw in rows:
+                acc_type = (acc_type_raw or "").upper().strip()
+                bal = float(bal_raw or 0.0)
                 accounts_by_name[name] = {
-                    "id": r["id"],
+                    "id": acc_id,
                     "type": acc_type,
                     "balance": bal,
                 }
-                if acc_type == "CREDITCARD":
-                    credit_card_names.append(name)
-                elif acc_type == "CHECKING":
-                    checking_names.append(name)
-                elif acc_type == "SAVINGS":
-                    savings_names.append(name)
-
-            return accounts_by_name, credit_card_names, checking_names, savings_names
+                buckets.get(acc_type, other).append(name)
+
+            return (
+                accounts_by_name,
+                buckets["CREDITCARD"],
+                buckets["CHECKING"],
+                buckets["SAVINGS"],
+            )
         finally:
             conn.close()
 
@@ -185,6 +232,44 @@ class BalanceUpdater:
             ans = default
         return ans in ("y", "yes")
 
+    def _prompt_match_selection(
+        self, proposals: List[Tuple[int, str, Any, str, float]]
+    ) -> set:
+        """Show all fuzzy match candidates once and read one selection.
+
+        Args:
+            proposals: Tuples of (row, excel_name, old_balance, candidate,
+                score) at or above the fuzzy threshold
+
+        Returns:
+            Set of approved 1-based proposal numbers; empty set when the
+            user declines everything (the default)
+        """
+        print("\n[debts] Potential fuzzy matches:")
+        for number, (row, excel_name, _old, candidate, score) in enumerate(
+            proposals, start=1
+        ):
+            print(
+                f"  {number}. row {row}: {excel_name} -> {candidate} (score {score})"
+            )
+
+        prompt = "Approve matches [e.g. 1,3 | all | none] (default none): "
+        try:
+            ans = input(prompt).strip().lower()
+        except EOFError:
+            ans = ""
+
+        if not ans or ans == "none":
+            return set()
+        if ans == "all":
+            return set(range(1, len(proposals) + 1))
+
+        approved = set()
+        for part in ans.replace(" ", "").split(","):
+            if part.isdigit() and 1 <= int(part) <= len(proposals):
+                approved.add(int(part))
+        return approved
+
     def update_debts_sheet(
         self, ws, accounts_by_name: Dict[str, Dict], credit_card_names: List[str]
     ) -> List[Dict]:
@@ -206,27 +291,65 @@ class BalanceUpdater:
         if not credit_card_names:
             return updates
 
-        # Iterate rows starting from row 2
-        for row in range(2, ws.max_row + 1):
-            excel_name_cell = ws.cell(row=row, column=1)  # Column A
-            balance_cell = ws.cell(row=row, column=2)  # Column B
+        # Set membership makes the per-row exact-match check O(1) instead
+        # of scanning the name list.
+        cc_set = set(credit_card_names)
+
+        # Normalize the Quicken names once up front; otherwise WRatio
+        # re-lowercases and re-strips the same choices for every Excel row.
+        if _default_process is not None:
+            cc_choices = [_default_process(name) for name in credit_card_names]
+        else:
+            cc_choices = credit_card_names
+
+        # The cache lives for one sheet pass, so duplicate Excel names
+        # (the same card listed on several rows) score only once.
+        @lru_cache(maxsize=None)
+        def best_match(query: str):
+            # score_cutoff lets the scorer abandon a candidate inside the
+            # C kernel once it provably cannot reach the threshold
+            if _default_process is not None:
+                return process.extractOne(
+                    _default_process(query),
+                    cc_choices,
+                    scorer=self.scorer,
+                    processor=None,
+                    score_cutoff=self.fuzzy_threshold,
+                )
+            return process.extractOne(
+                query,
+                cc_choices,
+                scorer=self.scorer,
+                score_cutoff=self.fuzzy_threshold,
+            )
+
+        # Pull columns A/B in one streaming pass; repeated ws.cell calls
+        # walk openpyxl's cell store and allocate a Cell per access.
+        sheet_rows = [
+            (row, values[0], values[1] if len(values) > 1 else None)
+            for row, values in enumerate(
+                ws.iter_rows(min_row=2, max_col=2, values_only=True), start=2
+            )
+        ]
+
+        # Rows needing fuzzy scoring, collected so they can batch
+        pending: List[Tuple[int, str, Any]] = []
 
-            excel_name = (excel_name_cell.value or "").strip()
+        for row, raw_name, old_balance in sheet_rows:
+            excel_name = (raw_name or "").strip()
             if not excel_name:
                 continue
 
-            old_balance = balance_cell.value
-
             # If exact match, update without prompt
-            if excel_name in credit_card_names:
+            if excel_name in cc_set:
                 qname = excel_name
                 qb = accounts_by_name[qname]["balance"]
                 new_balance = abs(qb)
 
                 # Only update if balance changed (use tolerance for floating point comparison)
                 if abs((old_balance or 0.0) - new_balance) > 0.01:
-                    balance_cell.value = float(new_balance)
-                    excel_name_cell.value = qname
+                    ws.cell(row=row, column=2, value=float(new_balance))
+                    ws.cell(row=row, column=1, value=qname)
                     updates.append(
                         {
                             "row": row,
@@ -240,52 +363,82 @@ class BalanceUpdater:
                     )
                 continue
 
-            # Fuzzy match to credit card names
-            match = process.extractOne(
-                excel_name, credit_card_names, scorer=fuzz.WRatio
+            pending.append((row, excel_name, old_balance))
+
+        # Score every remaining row against the card names in one batch.
+        # rapidfuzz's cdist releases the GIL and splits rows across cores
+        # (workers=-1); the thefuzz fallback keeps the memoized per-row
+        # extractOne path.
+        cdist = getattr(process, "cdist", None)
+        best: List[Optional[Tuple[str, float]]] = []
+        if pending and cdist is not None and _default_process is not None:
+            queries = [_default_process(name) for _, name, _ in pending]
+            score_matrix = cdist(
+                queries,
+                cc_choices,
+                scorer=self.scorer,
+                processor=None,
+                workers=-1,
+                score_cutoff=self.fuzzy_threshold,
             )
-            if not match:
-                continue
+            for row_scores in score_matrix:
+                j = int(row_scores.argmax())
+                best.append((credit_card_names[j], float(row_scores[j])))
+        else:
+            for _, excel_name, _ in pending:
+                match = best_match(excel_name)
+                if not match:
+                    best.append(None)
+                elif len(match) == 3:
+                    # rapidfuzz returns (choice, score, index); map the
+                    # normalized choice back to the original name
+                    best.append((credit_card_names[match[2]], match[1]))
+                else:
+                    # thefuzz returns (choice, score)
+                    best.append((match[0], match[1]))
+
+        proposals = [
+            (row, excel_name, old_balance, picked[0], picked[1])
+            for (row, excel_name, old_balance), picked in zip(pending, best)
+            if picked is not None and picked[1] >= self.fuzzy_threshold
+        ]
+        if not proposals:
+            return updates
 
-            # Handle both rapidfuzz (2-tuple) and thefuzz (3-tuple) return formats
-            if len(match) == 3:
-                candidate, score, _ = match
-            else:
-                candidate, score = match
+        # One table and one answer instead of a prompt per row, so human
+        # reaction time is paid once for the whole sheet
+        approved = self._prompt_match_selection(proposals)
 
-            if score < self.fuzzy_threshold:
+        for number, (row, excel_name, old_balance, candidate, score) in enumerate(
+            proposals, start=1
+        ):
+            if number not in approved:
                 continue
 
-            print("\n[debts] Potential match found:")
-            print(f"  Excel name   : {excel_name}")
-            print(f"  Quicken name : {candidate}")
-            print(f"  Score        : {score}")
+            qb = accounts_by_name[candidate]["balance"]
+            new_balance = abs(qb)
 
-            if self._prompt_yes_no("Approve this match?", default_no=True):
-                qb = accounts_by_name[candidate]["balance"]
-                new_balance = abs(qb)
+            # Update cell if balance or name changed
+            balance_changed = abs((old_balance or 0.0) - new_balance) > 0.01
+            name_changed = excel_name != candidate
+
+            if balance_changed or name_changed:
+                ws.cell(row=row, column=2, value=float(new_balance))
+                ws.cell(row=row, column=1, value=candidate)
 
-                # Update cell if balance or name changed
-                balance_changed = abs((old_balance or 0.0) - new_balance) > 0.01
-                name_changed = excel_name != candidate
-                
-                if balance_changed or name_changed:
-                    balance_cell.value = float(new_balance)
-                    excel_name_cell.value = candidate
-                    
-                    # Only report as update if balance actually changed
-                    if balance_changed:
-                        updates.append(
-                            {
-                                "row": row,
-                                "excel_name_old": excel_name,
-                                "excel_name_new": candidate,
-                                "old_balance": old_balance,
-                                "new_balance": new_balance,
-                                "score": score,
-                                "auto": False,
-                            }
-                        )
+                # Only report as update if balance actually changed
+                if balance_changed:
+                    updates.append(
+                        {
+                            "row": row,
+                            "excel_name_old": excel_name,
+                            "excel_name_new": candidate,
+                            "old_balance": old_balance,
+                            "new_balance": new_balance,
+                            "score": score,
+                            "auto": False,
+                        }
+                    )
 
         return updates
 
@@ -320,9 +473,9 @@ class BalanceUpdater:
 
         # Try fuzzy match
         if checking_names:
-            match = process.extractOne(target_name, checking_names, scorer=fuzz.WRatio)
+            match = process.extractOne(target_name, checking_names, scorer=self.scorer)
             if match:
-                # Handle both rapidfuzz (2-tuple) and thefuzz (3-tuple) return formats
+                # rapidfuzz returns (choice, score, index); thefuzz returns (choice, score)
                 if len(match) == 3:
                     candidate, score, _ = match
                 else:
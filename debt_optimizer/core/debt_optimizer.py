@@ -3,10 +3,12 @@
 This module is part of the Financial Debt Optimizer project.
 """
 
+from bisect import bisect_right
 from dataclasses import dataclass
 from datetime import date, datetime, timedelta
 from decimal import Decimal, ROUND_HALF_UP
 from enum import Enum
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple
 
 import pandas as pd
@@ -96,6 +98,105 @@ class DebtPaymentPlan:
     payoff_order: int
 
 
+def _to_cents(value: Any) -> int:
+    """Convert a money value to integer cents with half-up rounding."""
+    return int((Decimal(str(value)) * 100).to_integral_value(rounding=ROUND_HALF_UP))
+
+
+def _from_cents(cents: int) -> Decimal:
+    """Convert integer cents back to a two-decimal-place Decimal."""
+    return Decimal(cents).scaleb(-2)
+
+
+def compute_min_payment_reserves_arrays(
+    now_ord: int,
+    cash_cents: int,
+    inc_ords: List[int],
+    inc_cents: List[int],
+    due_ords: List[int],
+    min_cents: List[int],
+) -> Tuple[int, List[int]]:
+    """Integer-cent core of compute_min_payment_reserves.
+
+    Works on parallel arrays of date ordinals and cents so the sweep
+    runs on machine integers instead of Decimal objects and dict
+    lookups. Both the income and obligation arrays must be pre-sorted
+    by date; incomes are credited from one prefix sum via bisection
+    instead of a rescan per obligation.
+
+    Returns:
+        Tuple of (total_reserve_cents, per_obligation_reserve_cents)
+    """
+    credited = _credited_by_due(now_ord, inc_ords, inc_cents, due_ords)
+    return _reserve_chain(cash_cents, min_cents, credited)
+
+
+def _credited_by_due(
+    now_ord: int,
+    inc_ords: List[int],
+    inc_cents: List[int],
+    due_ords: List[int],
+) -> List[int]:
+    """Total income credited on or before each due date, in cents.
+
+    Prefix-sums the future incomes once, then bisects each due date;
+    only incomes strictly after `now` count as available. The stdlib
+    bisect beats NumPy here because typical calendars are far too
+    small to amortize array construction.
+    """
+    fut_ords: List[int] = []
+    inc_cum: List[int] = [0]
+    running = 0
+    for ord_, amt in zip(inc_ords, inc_cents):
+        if ord_ > now_ord:
+            fut_ords.append(ord_)
+            running += amt
+            inc_cum.append(running)
+    return [inc_cum[bisect_right(fut_ords, due)] for due in due_ords]
+
+
+def _reserve_chain(
+    cash_cents: int, min_cents: List[int], credited: List[int]
+) -> Tuple[int, List[int]]:
+    """Sequential cumulative-reserve dependency; stays a Python loop."""
+    reserves: List[int] = []
+    cumulative = 0
+    for min_amount, cred in zip(min_cents, credited):
+        shortfall = min_amount - cred
+        if shortfall < 0:
+            shortfall = 0
+        available = cash_cents - cumulative
+        if shortfall > available:
+            shortfall = available
+        reserves.append(shortfall)
+        cumulative += shortfall
+    return cumulative, reserves
+
+
+@lru_cache(maxsize=1024)
+def _reserves_cached(
+    now_ord: int,
+    cash_cents: int,
+    incomes: Tuple[Tuple[int, int], ...],
+    obligations: Tuple[Tuple[int, int], ...],
+) -> Tuple[int, Tuple[int, ...]]:
+    """Memoized wrapper around the array kernel.
+
+    The computation is pure, so repeated calls with the same canonical
+    integer key (what-if reruns, repeated scenarios) collapse to a dict
+    lookup. Inputs must already be sorted by date ordinal.
+    """
+    total, reserves = compute_min_payment_reserves_arrays(
+        now_ord,
+        cash_cents,
+        [inc[0] for inc in incomes],
+        [inc[1] for inc in incomes],
+        [ob[0] for ob in obligations],
+        [ob[1] for ob in obligations],
+    )
+    return total, tuple(reserves)
+
+
 def compute_min_payment_reserves(
     now: date,
     cash_on_hand: Decimal,
@@ -134,62 +235,173 @@ def compute_min_payment_reserves(
         - obligations = [{debt_name: "Prime Visa", due_date: 2025-11-19, min_amount: 805}]
         - Result: total_reserve = 215.00 (805 - 590), per_obligation = {"Prime Visa": 215}
     """
-    # Sort obligations by due date (earliest first)
-    sorted_obligations = sorted(obligations, key=lambda x: x["due_date"])
-
-    # Sort incomes by date
-    sorted_incomes = sorted(incomes, key=lambda x: x["date"])
-
-    # Track total reserve needed and per-obligation reserves
-    total_reserve = Decimal("0.00")
-    per_obligation_reserve = {}
-
-    # Running balance: what we'll have available as we move through time
-    # Start with current cash minus cumulative reserves
-    cumulative_reserved = Decimal("0.00")
-
-    for obligation in sorted_obligations:
-        debt_name = obligation["debt_name"]
-        due_date = obligation["due_date"]
-        min_amount = Decimal(str(obligation["min_amount"]))
-
-        # Calculate total income available by the due date (inclusive)
-        # This is income that will arrive AFTER now and ON OR BEFORE due date
-        income_by_due_date = sum(
-            Decimal(str(inc["amount"]))
-            for inc in sorted_incomes
-            if now < inc["date"] <= due_date
+    # Fast path: a single obligation needs no sorting, prefix sums or
+    # cache key construction -- just one credited-income sum.
+    if len(obligations) == 1:
+        ob = obligations[0]
+        now_ord = now.toordinal()
+        due_ord = ob["due_date"].toordinal()
+        credited = sum(
+            _to_cents(inc["amount"])
+            for inc in incomes
+            if now_ord < inc["date"].toordinal() <= due_ord
         )
+        shortfall = _to_cents(ob["min_amount"]) - credited
+        if shortfall < 0:
+            shortfall = 0
+        cash_cents = _to_cents(cash_on_hand)
+        if shortfall > cash_cents:
+            shortfall = cash_cents
+        reserve = _from_cents(shortfall)
+        return reserve, {ob["debt_name"]: reserve}
+
+    # Extract each dict field exactly once, then sort the parallel rows
+    # by date (stable, earliest first); the sweep itself runs in the
+    # memoized integer kernel over the canonical key.
+    ob_rows = sorted(
+        (
+            (ob["due_date"].toordinal(), _to_cents(ob["min_amount"]), ob["debt_name"])
+            for ob in obligations
+        ),
+        key=lambda row: row[0],
+    )
+    inc_rows = sorted(
+        (inc["date"].toordinal(), _to_cents(inc["amount"])) for inc in incomes
+    )
+
+    now_ord = now.toordinal()
+    cash_cents = _to_cents(cash_on_hand)
+    ob_key = tuple(row[:2] for row in ob_rows)
+
+    total_cents, reserves = _reserves_cached(
+        now_ord, cash_cents, tuple(inc_rows), ob_key
+    )
+
+    per_obligation_reserve = {
+        row[2]: _from_cents(res) for row, res in zip(ob_rows, reserves)
+    }
+    total_reserve = _from_cents(total_cents)
 
-        # Key insight: We need to reserve from CURRENT cash any shortfall between
-        # the obligation amount and future income. This ensures that if we spend
-        # the remaining cash on extra payments, we'll still have enough when
-        # combined with future income to meet the obligation.
-        #
-        # For example, if we need $805 on Nov 19, and will receive $590 on Nov 12,
-        # we must reserve $215 NOW (on Nov 11) to ensure we have enough.
-        
-        # Calculate shortfall: what portion of the minimum payment is NOT covered by future income
-        income_shortfall = max(Decimal("0.00"), min_amount - income_by_due_date)
-        
-        # But we can't reserve more than we have available after previous reservations
-        available_cash_now = cash_on_hand - cumulative_reserved
-        
-        # Reserve the lesser of the shortfall and available cash
-        # (if available cash is less than shortfall, we're in trouble, but reserve what we can)
-        shortfall = min(income_shortfall, available_cash_now)
+    return total_reserve, per_obligation_reserve
 
-        # Reserve the shortfall
-        per_obligation_reserve[debt_name] = shortfall.quantize(
-            Decimal("0.01"), rounding=ROUND_HALF_UP
-        )
-        cumulative_reserved += shortfall
-        total_reserve += shortfall
 
-    # Quantize total reserve to cents
-    total_reserve = total_reserve.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+def compute_min_payment_reserves_capacitated(
+    now: date,
+    cash_on_hand: Decimal,
+    incomes: List[Dict[str, Any]],
+    obligations: List[Dict[str, Any]],
+) -> Tuple[Decimal, Dict[str, Decimal], Dict[str, Decimal]]:
+    """Reserve minimum payments and surface any funding deficits.
 
-    return total_reserve, per_obligation_reserve
+    compute_min_payment_reserves silently reserves only what cash on
+    hand allows; when the plan is infeasible the caller cannot tell.
+    This variant runs the same chronological sweep but also reports,
+    per obligation, the amount that neither cash nor prior income can
+    cover, so callers can flag the schedule instead of under-reserving.
+
+    Args:
+        now: Current date for which to calculate reserves
+        cash_on_hand: Current available cash (as Decimal)
+        incomes: List of future income events, each with 'date' and 'amount' keys
+        obligations: List of minimum payment obligations, each with 'debt_name',
+                    'due_date', and 'min_amount' keys
+
+    Returns:
+        Tuple of (total_reserve, per_obligation_reserve_map, deficit_map)
+        where deficit_map contains only obligations that cannot be fully
+        funded; an empty deficit_map means the schedule is feasible.
+    """
+    ob_rows = sorted(
+        (
+            (ob["due_date"].toordinal(), _to_cents(ob["min_amount"]), ob["debt_name"])
+            for ob in obligations
+        ),
+        key=lambda row: row[0],
+    )
+    inc_rows = sorted(
+        (inc["date"].toordinal(), _to_cents(inc["amount"])) for inc in incomes
+    )
+
+    credited = _credited_by_due(
+        now.toordinal(),
+        [r[0] for r in inc_rows],
+        [r[1] for r in inc_rows],
+        [row[0] for row in ob_rows],
+    )
+
+    cash_cents = _to_cents(cash_on_hand)
+    per_obligation_reserve: Dict[str, Decimal] = {}
+    deficits: Dict[str, Decimal] = {}
+    cumulative = 0
+    for (due_ord, min_amount, name), cred in zip(ob_rows, credited):
+        needed = min_amount - cred
+        if needed < 0:
+            needed = 0
+        available = cash_cents - cumulative
+        if available < 0:
+            available = 0
+        reserve = needed if needed <= available else available
+        if needed > reserve:
+            deficits[name] = _from_cents(needed - reserve)
+        per_obligation_reserve[name] = _from_cents(reserve)
+        cumulative += reserve
+
+    return _from_cents(cumulative), per_obligation_reserve, deficits
+
+
+def compute_min_payment_reserves_batch(
+    now: date,
+    cash_on_hand_values: List[Decimal],
+    incomes: List[Dict[str, Any]],
+    obligations: List[Dict[str, Any]],
+) -> Tuple[List[Decimal], List[Dict[str, Decimal]]]:
+    """Evaluate many cash-on-hand scenarios against one calendar.
+
+    Sensitivity analyses re-run compute_min_payment_reserves with the
+    same incomes and obligations but different cash levels; this entry
+    point converts the calendar and prefix-sums the credited income
+    once, then runs only the cheap reserve chain per scenario.
+
+    Args:
+        now: Current date for which to calculate reserves
+        cash_on_hand_values: Cash-on-hand amount per scenario
+        incomes: List of future income events, each with 'date' and 'amount' keys
+        obligations: List of minimum payment obligations, each with 'debt_name',
+                    'due_date', and 'min_amount' keys
+
+    Returns:
+        Tuple of (total_reserves, per_obligation_reserve_maps), each
+        aligned with cash_on_hand_values.
+    """
+    ob_rows = sorted(
+        (
+            (ob["due_date"].toordinal(), _to_cents(ob["min_amount"]), ob["debt_name"])
+            for ob in obligations
+        ),
+        key=lambda row: row[0],
+    )
+    inc_rows = sorted(
+        (inc["date"].toordinal(), _to_cents(inc["amount"])) for inc in incomes
+    )
+
+    now_ord = now.toordinal()
+    due_ords = [row[0] for row in ob_rows]
+    min_cents = [row[1] for row in ob_rows]
+    names = [row[2] for row in ob_rows]
+
+    credited = _credited_by_due(
+        now_ord, [r[0] for r in inc_rows], [r[1] for r in inc_rows], due_ords
+    )
+
+    totals: List[Decimal] = []
+    reserve_maps: List[Dict[str, Decimal]] = []
+    for cash in cash_on_hand_values:
+        total_cents, reserves = _reserve_chain(_to_cents(cash), min_cents, credited)
+        totals.append(_from_cents(total_cents))
+        reserve_maps.append(
+            {name: _from_cents(res) for name, res in zip(names, reserves)}
+        )
+    return totals, reserve_maps
 
 
 class DebtOptimizer:
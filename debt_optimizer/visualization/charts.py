@@ -8,6 +8,8 @@ from typing import Dict, List, Optional, Tuple
 
 import matplotlib.pyplot as plt
 import pandas as pd
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 
 from debt_optimizer.core.debt_optimizer import OptimizationResult
 from debt_optimizer.core.financial_calc import Debt
@@ -38,15 +40,30 @@ class DebtVisualization:
             "#17becf",
         ]
 
+    @staticmethod
+    def _make_figure(figsize: Tuple[int, int]) -> Figure:
+        """Build a figure without registering it in pyplot's figure manager.
+
+        Figures created through plt.subplots/plt.figure are tracked globally
+        until plt.close, which adds per-figure bookkeeping and keeps charts
+        alive between calls. An explicit Figure with an Agg canvas renders
+        and saves identically but is freed as soon as the caller drops it.
+        """
+        fig = Figure(figsize=figsize)
+        FigureCanvasAgg(fig)
+        return fig
+
     def plot_debt_progression(
         self,
         debt_progression: pd.DataFrame,
         save_path: Optional[str] = None,
         figsize: Tuple[int, int] = (12, 8),
+        dpi: int = 300,
     ) -> plt.Figure:
         """Create a line chart showing debt balance progression over time."""
 
-        fig, ax = plt.subplots(figsize=figsize)
+        fig = self._make_figure(figsize)
+        ax = fig.subplots()
 
         # Get debt columns (exclude month and date)
         debt_columns = [
@@ -88,10 +105,10 @@ class DebtVisualization:
             else:
                 ax.legend(bbox_to_anchor=(1.05, 1), loc="upper left", ncol=2)
 
-        plt.tight_layout()
+        fig.tight_layout()
 
         if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches="tight")
+            fig.savefig(save_path, dpi=dpi, bbox_inches="tight")
 
         return fig
 
@@ -100,10 +117,12 @@ class DebtVisualization:
         monthly_summary: pd.DataFrame,
         save_path: Optional[str] = None,
         figsize: Tuple[int, int] = (12, 8),
+        dpi: int = 300,
     ) -> plt.Figure:
         """Create a stacked bar chart showing principal vs interest payments."""
 
-        fig, ax = plt.subplots(figsize=figsize)
+        fig = self._make_figure(figsize)
+        ax = fig.subplots()
 
         # Create stacked bar chart
         bar_width = 0.8
@@ -147,10 +166,10 @@ class DebtVisualization:
         # Legend
         ax.legend(loc="upper right")
 
-        plt.tight_layout()
+        fig.tight_layout()
 
         if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches="tight")
+            fig.savefig(save_path, dpi=dpi, bbox_inches="tight")
 
         return fig
 
@@ -159,10 +178,12 @@ class DebtVisualization:
         comparison_df: pd.DataFrame,
         save_path: Optional[str] = None,
         figsize: Tuple[int, int] = (14, 10),
+        dpi: int = 300,
     ) -> plt.Figure:
         """Create a comparison chart for different debt strategies."""
 
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=figsize)
+        fig = self._make_figure(figsize)
+        (ax1, ax2), (ax3, ax4) = fig.subplots(2, 2)
 
         strategies = comparison_df["strategy"].str.replace("_", " ").str.title()
 
@@ -260,13 +281,13 @@ class DebtVisualization:
                 fontsize=10,
             )
 
-        plt.suptitle(
+        fig.suptitle(
             "Debt Repayment Strategy Comparison", fontsize=16, fontweight="bold"
         )
-        plt.tight_layout()
+        fig.tight_layout()
 
         if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches="tight")
+            fig.savefig(save_path, dpi=dpi, bbox_inches="tight")
 
         return fig
 
@@ -275,10 +296,12 @@ class DebtVisualization:
         debts: List[Debt],
         save_path: Optional[str] = None,
         figsize: Tuple[int, int] = (10, 8),
+        dpi: int = 300,
     ) -> plt.Figure:
         """Create a pie chart showing debt composition by balance."""
 
-        fig, ax = plt.subplots(figsize=figsize)
+        fig = self._make_figure(figsize)
+        ax = fig.subplots()
 
         # Prepare data
         debt_names = [debt.name for debt in debts]
@@ -320,10 +343,10 @@ class DebtVisualization:
         ]
         ax.legend(legend_labels, bbox_to_anchor=(1.05, 1), loc="upper left")
 
-        plt.tight_layout()
+        fig.tight_layout()
 
         if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches="tight")
+            fig.savefig(save_path, dpi=dpi, bbox_inches="tight")
 
         return fig
 
@@ -332,10 +355,12 @@ class DebtVisualization:
         debts: List[Debt],
         save_path: Optional[str] = None,
         figsize: Tuple[int, int] = (12, 8),
+        dpi: int = 300,
     ) -> plt.Figure:
         """Create a horizontal bar chart comparing interest rates."""
 
-        fig, ax = plt.subplots(figsize=figsize)
+        fig = self._make_figure(figsize)
+        ax = fig.subplots()
 
         # Sort debts by interest rate
         sorted_debts = sorted(debts, key=lambda d: d.interest_rate, reverse=True)
@@ -384,10 +409,10 @@ class DebtVisualization:
         # Add grid
         ax.grid(True, alpha=0.3, axis="x")
 
-        plt.tight_layout()
+        fig.tight_layout()
 
         if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches="tight")
+            fig.savefig(save_path, dpi=dpi, bbox_inches="tight")
 
         return fig
 
@@ -398,14 +423,15 @@ class DebtVisualization:
         comparison_df: Optional[pd.DataFrame] = None,
         save_path: Optional[str] = None,
         figsize: Tuple[int, int] = (20, 16),
+        dpi: int = 300,
     ) -> plt.Figure:
         """Create a comprehensive dashboard with multiple charts."""
 
         if comparison_df is not None:
-            fig = plt.figure(figsize=figsize)
+            fig = self._make_figure(figsize)
             gs = fig.add_gridspec(3, 3, hspace=0.3, wspace=0.3)
         else:
-            fig = plt.figure(figsize=(16, 12))
+            fig = self._make_figure((16, 12))
             gs = fig.add_gridspec(2, 2, hspace=0.3, wspace=0.3)
 
         # Debt Progression Chart
@@ -529,10 +555,10 @@ Time Saved: {optimization_result.savings_vs_minimum['months_saved']} months
                 bbox=dict(boxstyle="round", facecolor="lightblue", alpha=0.8),
             )
 
-        plt.suptitle("Debt Optimization Dashboard", fontsize=18, fontweight="bold")
+        fig.suptitle("Debt Optimization Dashboard", fontsize=18, fontweight="bold")
 
         if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches="tight")
+            fig.savefig(save_path, dpi=dpi, bbox_inches="tight")
 
         return fig
 
@@ -425,10 +425,16 @@ def main():
         # Run check-only mode (like CI)
         print("🔍 Running formatting checks only (no changes will be made)")
 
+        # Only pass directories that exist; black and isort error out on
+        # missing paths rather than skipping them.
+        check_dirs = [
+            d for d in ("src", "tests", "scripts") if (project_root / d).is_dir()
+        ]
+
         try:
             # Check Black formatting
             result = subprocess.run(
-                ["black", "--check", "--diff", "src", "tests", "scripts"],
+                ["black", "--check", "--diff"] + check_dirs,
                 cwd=project_root,
                 capture_output=True,
             )
@@ -439,7 +445,7 @@ def main():
 
             # Check isort
             result = subprocess.run(
-                ["isort", "--check-only", "--diff", "src", "tests", "scripts"],
+                ["isort", "--check-only", "--diff"] + check_dirs,
                 cwd=project_root,
                 capture_output=True,
             )
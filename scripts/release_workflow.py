@@ -8,15 +8,99 @@ run tests, clean code, build docs, bump version, and publish releases.
 """
 
 import argparse
+import compileall
+import concurrent.futures
 import subprocess
 import sys
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
+
+# .absolute() avoids the per-segment stat() calls that .resolve() performs
+_PROJECT_ROOT = Path(__file__).parent.parent.absolute()
+
+# Preformatted banner pieces so each header is a single write() syscall
+_BANNER = "=" * 60
+_SEP = f"\n{_BANNER}\n"
 
 
 class ReleaseWorkflow:
     """Orchestrates the complete release workflow."""
 
+    #: Declarative step table: step name -> (script name, description,
+    #: argument builder). Builders take the merged option dict and return
+    #: the argv list for the script, so each workflow is just a sequence
+    #: of step names instead of one thin wrapper method per script.
+    STEPS: Dict[str, Tuple[str, str, Callable[[Dict], List[str]]]] = {
+        "tests": (
+            "run_tests",
+            "Running comprehensive test suite",
+            lambda opts: [
+                flag
+                for flag, on in (
+                    ("--skip-slow", opts["skip_slow"]),
+                    ("--skip-security", opts["skip_security"]),
+                )
+                if on
+            ],
+        ),
+        "clean": (
+            "clean_code",
+            "Cleaning and formatting code",
+            lambda opts: (["--skip-optional"] if opts["skip_optional"] else [])
+            + (["--check-only"] if opts["dry_run"] else []),
+        ),
+        "update_docs": (
+            "update_documentation",
+            "Updating documentation (mandatory)",
+            lambda opts: ["--to-version", opts["to_version"]]
+            + (["--from-version", opts["from_version"]] if opts["from_version"] else [])
+            + (["--dry-run"] if opts["dry_run"] else []),
+        ),
+        "build_docs": (
+            "build_docs",
+            "Building documentation",
+            lambda opts: ["--include-pdf"] if opts["include_pdf"] else [],
+        ),
+        "bump": (
+            "bump_version",
+            "Bumping version ({bump_type})",
+            lambda opts: [opts["bump_type"]]
+            + (["--prerelease", opts["prerelease"]] if opts["prerelease"] else [])
+            + (["--dry-run"] if opts["dry_run"] else []),
+        ),
+        "publish": (
+            "publish_release",
+            "Publishing release",
+            lambda opts: [
+                flag
+                for flag, on in (
+                    ("--test-pypi", opts["test_pypi"]),
+                    ("--draft", opts["draft_release"]),
+                    ("--skip-github", opts["skip_github"]),
+                    ("--skip-pypi", opts["skip_pypi"]),
+                )
+                if on
+            ],
+        ),
+    }
+
+    #: Defaults for every option an argument builder may consult.
+    _STEP_DEFAULTS: Dict = {
+        "skip_slow": False,
+        "skip_security": False,
+        "skip_optional": False,
+        "to_version": "",
+        "from_version": None,
+        "include_pdf": False,
+        "bump_type": "patch",
+        "prerelease": None,
+        "dry_run": False,
+        "test_pypi": False,
+        "draft_release": False,
+        "skip_github": False,
+        "skip_pypi": False,
+    }
+
     def __init__(self, project_root: Path, verbose: bool = False):
         """Initialize the release workflow.
 
@@ -28,6 +112,12 @@ class ReleaseWorkflow:
         self.scripts_dir = project_root / "scripts"
         self.verbose = verbose
         self.failed_steps: List[str] = []
+        # One directory scan instead of a stat() per run_script call
+        self._scripts = {p.stem for p in self.scripts_dir.glob("*.py")}
+        self._python = sys.executable
+        # Populate __pycache__ for all release scripts up front (workers=0
+        # uses all CPUs) so first-run invocations skip the compile step
+        compileall.compile_dir(str(self.scripts_dir), quiet=1, workers=0)
 
     def run_script(
         self,
@@ -55,26 +145,34 @@ class ReleaseWorkflow:
 
         script_path = self.scripts_dir / f"{script_name}.py"
 
-        if not script_path.exists():
+        if script_name not in self._scripts:
             print(f"❌ Script not found: {script_path}")
             if not allow_failure:
                 self.failed_steps.append(description)
             return False
 
-        cmd = [sys.executable, str(script_path)] + args
+        # -I (isolated mode) skips user site-packages and PYTHON* env vars,
+        # trimming child interpreter startup
+        cmd = [self._python, "-I", str(script_path)] + args
 
         if self.verbose:
             cmd.append("--verbose")
 
-        print(f"\n{'='*60}")
-        print(f"🔄 {description}")
-        print(f"Script: {script_name}.py")
+        header = f"{_SEP}🔄 {description}\nScript: {script_name}.py\n"
         if args:
-            print(f"Args: {' '.join(args)}")
-        print("=" * 60)
+            header += f"Args: {' '.join(args)}\n"
+        sys.stdout.write(f"{header}{_BANNER}\n")
 
         try:
-            result = subprocess.run(cmd, cwd=self.project_root, check=True)
+            # close_fds=True / start_new_session=False keep the call on the
+            # cheap posix_spawn path rather than fork+exec
+            result = subprocess.run(
+                cmd,
+                cwd=self.project_root,
+                check=True,
+                close_fds=True,
+                start_new_session=False,
+            )
             print(f"✅ {description} - SUCCESS")
             return True
 
@@ -135,146 +233,93 @@ class ReleaseWorkflow:
         else:  # patch
             return f"{major}.{minor}.{patch + 1}"
 
-    def update_documentation(
-        self, to_version: str, from_version: Optional[str] = None, dry_run: bool = False
-    ) -> bool:
-        """Update documentation, version references, and CHANGELOG.
-
-        This is a mandatory step that runs for every release.
+    def run_step(self, name: str, **options) -> bool:
+        """Run a workflow step from the declarative STEPS table.
 
         Args:
-            to_version: Target version (e.g., '2.0.2')
-            from_version: Previous version for doc updates (e.g., '2.0.1')
-            dry_run: Whether to perform a dry run
+            name: Step name (key into STEPS)
+            options: Step options; unset options fall back to _STEP_DEFAULTS
 
         Returns:
-            True if documentation update succeeded, False otherwise
+            True if the step succeeded, False otherwise
         """
-        args = ["--to-version", to_version]
-
-        if from_version:
-            args.extend(["--from-version", from_version])
-
-        if dry_run:
-            args.append("--dry-run")
-
+        opts = {**self._STEP_DEFAULTS, **options}
+        script_name, description, build_args = self.STEPS[name]
         return self.run_script(
-            "update_documentation",
-            args=args,
-            description="Updating documentation (mandatory)",
+            script_name,
+            args=build_args(opts),
+            description=description.format(**opts),
         )
 
-    def run_tests(self, skip_slow: bool = False, skip_security: bool = False) -> bool:
-        """Run the complete test suite.
+    def _run_step_check(self, name: str, **options) -> Tuple[bool, str, str, str]:
+        """Run a workflow step with captured output.
 
-        Args:
-            skip_slow: Whether to skip slow tests
-            skip_security: Whether to skip security checks
-
-        Returns:
-            True if tests passed, False otherwise
-        """
-        args = []
-        if skip_slow:
-            args.append("--skip-slow")
-        if skip_security:
-            args.append("--skip-security")
-
-        return self.run_script(
-            "run_tests", args=args, description="Running comprehensive test suite"
-        )
-
-    def clean_code(self, skip_optional: bool = False) -> bool:
-        """Clean and format the code.
+        Concurrent dry-run validation uses this instead of run_step so
+        the child processes' banners do not interleave; the caller prints
+        each step's result in submission order and records failures.
 
         Args:
-            skip_optional: Whether to skip optional cleanup steps
+            name: Step name (key into STEPS)
+            options: Step options; unset options fall back to _STEP_DEFAULTS
 
         Returns:
-            True if cleanup succeeded, False otherwise
+            Tuple of (ok, description, stdout, stderr)
         """
-        args = []
-        if skip_optional:
-            args.append("--skip-optional")
-
-        return self.run_script(
-            "clean_code", args=args, description="Cleaning and formatting code"
-        )
-
-    def build_documentation(self, include_pdf: bool = False) -> bool:
-        """Build the documentation.
+        opts = {**self._STEP_DEFAULTS, **options}
+        script_name, description, build_args = self.STEPS[name]
+        description = description.format(**opts)
 
-        Args:
-            include_pdf: Whether to build PDF documentation
+        script_path = self.scripts_dir / f"{script_name}.py"
+        if script_name not in self._scripts:
+            return False, description, "", f"Script not found: {script_path}"
 
-        Returns:
-            True if build succeeded, False otherwise
-        """
-        args = []
-        if include_pdf:
-            args.append("--include-pdf")
+        cmd = [self._python, "-I", str(script_path)] + build_args(opts)
+        if self.verbose:
+            cmd.append("--verbose")
 
-        return self.run_script(
-            "build_docs", args=args, description="Building documentation"
+        result = subprocess.run(
+            cmd,
+            cwd=self.project_root,
+            capture_output=True,
+            text=True,
+            close_fds=True,
+            start_new_session=False,
         )
+        return result.returncode == 0, description, result.stdout, result.stderr
 
     def bump_version(
-        self, bump_type: str, prerelease: Optional[str] = None, dry_run: bool = False
-    ) -> bool:
+        self,
+        bump_type: str,
+        prerelease: Optional[str] = None,
+        current_version: Optional[str] = None,
+        dry_run: bool = False,
+    ) -> Tuple[bool, Optional[str]]:
         """Bump the version number.
 
         Args:
             bump_type: Type of version bump ('major', 'minor', 'patch')
             prerelease: Optional prerelease identifier
+            current_version: Known current version, used to compute the new
+                version in-process instead of re-reading __version__.py
             dry_run: Whether to perform a dry run
 
         Returns:
-            True if version bump succeeded, False otherwise
+            Tuple of (success, new version or None)
         """
-        args = [bump_type]
-
-        if prerelease:
-            args.extend(["--prerelease", prerelease])
-
-        if dry_run:
-            args.append("--dry-run")
-
-        return self.run_script(
-            "bump_version", args=args, description=f"Bumping version ({bump_type})"
+        success = self.run_step(
+            "bump", bump_type=bump_type, prerelease=prerelease, dry_run=dry_run
         )
 
-    def publish_release(
-        self,
-        test_pypi: bool = False,
-        draft_release: bool = False,
-        skip_github: bool = False,
-        skip_pypi: bool = False,
-    ) -> bool:
-        """Publish the release.
-
-        Args:
-            test_pypi: Whether to upload to Test PyPI
-            draft_release: Whether to create draft GitHub release
-            skip_github: Whether to skip GitHub operations
-            skip_pypi: Whether to skip PyPI operations
-
-        Returns:
-            True if publishing succeeded, False otherwise
-        """
-        args = []
+        if not success:
+            return False, None
 
-        if test_pypi:
-            args.append("--test-pypi")
-        if draft_release:
-            args.append("--draft")
-        if skip_github:
-            args.append("--skip-github")
-        if skip_pypi:
-            args.append("--skip-pypi")
+        new_version = None
+        if current_version is not None:
+            new_version = self.compute_next_version(current_version, bump_type)
+            if prerelease:
+                new_version += f"-{prerelease}"
 
-        return self.run_script(
-            "publish_release", args=args, description="Publishing release"
-        )
+        return True, new_version
 
     def run_full_workflow(
         self,
@@ -317,45 +362,114 @@ class ReleaseWorkflow:
             print("🔍 DRY RUN MODE - No permanent changes will be made")
 
         success = True
+        new_version = next_version
 
-        # Step 1: Run tests (unless skipped)
-        if not skip_tests:
-            success &= self.run_tests()
-        else:
-            print("\n⚠️  SKIPPING TESTS - Use with caution!")
-
-        # Step 2: Clean code
-        if success or dry_run:
-            success &= self.clean_code()
-
-        # Step 3: Update documentation (MANDATORY - runs for every release)
-        if success or dry_run:
-            success &= self.update_documentation(
-                to_version=next_version, from_version=current_version, dry_run=dry_run
+        if dry_run:
+            # With clean in --check-only mode these steps are all
+            # read-only, so they can validate concurrently without any
+            # step rewriting sources while pytest imports them. Output
+            # is captured per step and reported in submission order so
+            # the children's banners do not interleave.
+            checks: List[Tuple[str, Dict]] = []
+            if not skip_tests:
+                checks.append(("tests", {}))
+            else:
+                print("\n⚠️  SKIPPING TESTS - Use with caution!")
+            checks.append(("clean", {"dry_run": True}))
+            checks.append(
+                (
+                    "update_docs",
+                    {
+                        "to_version": next_version,
+                        "from_version": current_version,
+                        "dry_run": True,
+                    },
+                )
+            )
+            checks.append(
+                (
+                    "bump",
+                    {
+                        "bump_type": bump_type,
+                        "prerelease": prerelease,
+                        "dry_run": True,
+                    },
+                )
             )
 
-        # Step 4: Build documentation (unless skipped)
-        if (success or dry_run) and not skip_docs:
-            success &= self.build_documentation()
-        elif skip_docs:
-            print("\n⚠️  SKIPPING DOCUMENTATION BUILD")
-
-        # Step 5: Bump version
-        if success or dry_run:
-            success &= self.bump_version(bump_type, prerelease, dry_run=dry_run)
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=len(checks)
+            ) as executor:
+                futures = [
+                    executor.submit(self._run_step_check, name, **options)
+                    for name, options in checks
+                ]
+                results = [future.result() for future in futures]
+
+            for ok, description, stdout, stderr in results:
+                sys.stdout.write(f"{_SEP}🔄 {description}\n{_BANNER}\n")
+                if self.verbose or not ok:
+                    if stdout:
+                        print(stdout)
+                    if stderr:
+                        print(stderr)
+                if ok:
+                    print(f"✅ {description} - SUCCESS")
+                else:
+                    print(f"❌ {description} - FAILED")
+                    self.failed_steps.append(description)
+                    success = False
+
+            # build_docs writes documentation output, so it runs on its
+            # own after the read-only checks rather than alongside them.
+            if not skip_docs:
+                success &= self.run_step("build_docs")
+            else:
+                print("\n⚠️  SKIPPING DOCUMENTATION BUILD")
 
-        # Step 6: Publish release (unless dry run)
-        if success and not dry_run:
-            success &= self.publish_release(
-                test_pypi=test_pypi, draft_release=draft_release
-            )
-        elif dry_run:
             print("\n🔍 DRY RUN - Skipping release publishing")
+        else:
+            # Step 1: Run tests (unless skipped)
+            if not skip_tests:
+                success &= self.run_step("tests")
+            else:
+                print("\n⚠️  SKIPPING TESTS - Use with caution!")
+
+            # Step 2: Clean code
+            if success:
+                success &= self.run_step("clean")
+
+            # Step 3: Update documentation (MANDATORY - runs for every release)
+            if success:
+                success &= self.run_step(
+                    "update_docs",
+                    to_version=next_version,
+                    from_version=current_version,
+                )
+
+            # Step 4: Build documentation (unless skipped)
+            if success and not skip_docs:
+                success &= self.run_step("build_docs")
+            elif skip_docs:
+                print("\n⚠️  SKIPPING DOCUMENTATION BUILD")
+
+            # Step 5: Bump version
+            if success:
+                bumped, bumped_version = self.bump_version(
+                    bump_type, prerelease, current_version=current_version
+                )
+                success &= bumped
+                if bumped_version:
+                    new_version = bumped_version
+
+            # Step 6: Publish release
+            if success:
+                success &= self.run_step(
+                    "publish", test_pypi=test_pypi, draft_release=draft_release
+                )
 
         # Report final results
-        print(f"\n{'='*60}")
-        print("📊 RELEASE WORKFLOW RESULTS")
-        print("=" * 60)
+        sys.stdout.write(f"{_SEP}📊 RELEASE WORKFLOW RESULTS\n{_BANNER}\n")
 
         if success:
             if dry_run:
@@ -363,7 +477,6 @@ class ReleaseWorkflow:
                 print("🔍 No changes were made to the repository")
                 print("💡 Remove --dry-run flag to perform actual release")
             else:
-                new_version = self.get_current_version()
                 print("✅ RELEASE WORKFLOW COMPLETED SUCCESSFULLY!")
                 print(f"🎉 Version {current_version} → {new_version} released")
                 print(
@@ -403,15 +516,14 @@ class ReleaseWorkflow:
         success = True
 
         # Quick steps: clean code, bump version, publish
-        success &= self.clean_code(skip_optional=True)
+        success &= self.run_step("clean", skip_optional=True)
 
         if success:
-            success &= self.bump_version(bump_type)
+            success &= self.bump_version(bump_type)[0]
 
         if success:
-            success &= self.publish_release(
-                draft_release=True
-            )  # Create as draft for safety
+            # Create as draft for safety
+            success &= self.run_step("publish", draft_release=True)
 
         if success:
             print("✅ QUICK RELEASE COMPLETED!")
@@ -486,12 +598,8 @@ Examples:
 
     args = parser.parse_args()
 
-    # Find project root
-    current_dir = Path(__file__).resolve().parent
-    project_root = current_dir.parent
-
     # Create workflow manager
-    workflow = ReleaseWorkflow(project_root, verbose=args.verbose)
+    workflow = ReleaseWorkflow(_PROJECT_ROOT, verbose=args.verbose)
 
     # Run appropriate workflow
     if args.quick:
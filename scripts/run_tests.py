@@ -7,24 +7,45 @@ It mimics the CI/CD pipeline locally for release preparation.
 """
 
 import argparse
+import concurrent.futures
+import hashlib
+import json
 import subprocess
 import sys
+import time
 from pathlib import Path
 from typing import List, Optional
 
+# .absolute() avoids the per-segment stat() calls that .resolve() performs
+_PROJECT_ROOT = Path(__file__).parent.parent.absolute()
+
+# Preformatted banner pieces so each header is a single write() syscall
+_BANNER = "=" * 60
+_SEP = f"\n{_BANNER}\n"
+
+# A green safety scan only stays valid as long as its vulnerability
+# database does, so cached results expire after a day regardless of
+# whether the requirements files changed.
+_SAFETY_CACHE_TTL = 24 * 60 * 60
+
 
 class TestRunner:
     """Manages running tests and quality checks for the project."""
 
-    def __init__(self, project_root: Path, verbose: bool = False):
+    def __init__(
+        self, project_root: Path, verbose: bool = False, json_output: bool = False
+    ):
         """Initialize the test runner.
 
         Args:
             project_root: Path to the project root directory
             verbose: Whether to show detailed output
+            json_output: Whether to write machine-readable security reports
+                to files (for CI consumption)
         """
         self.project_root = project_root
         self.verbose = verbose
+        self.json_output = json_output
         self.failed_checks: List[str] = []
 
     def run_command(
@@ -40,10 +61,9 @@ class TestRunner:
         Returns:
             True if command succeeded, False otherwise
         """
-        print(f"\n{'='*60}")
-        print(f"Running: {description}")
-        print(f"Command: {' '.join(cmd)}")
-        print("=" * 60)
+        sys.stdout.write(
+            f"{_SEP}Running: {description}\nCommand: {' '.join(cmd)}\n{_BANNER}\n"
+        )
 
         try:
             result = subprocess.run(
@@ -116,62 +136,116 @@ class TestRunner:
         print("✅ All dependencies available")
         return True
 
-    def run_code_formatting_checks(self) -> bool:
-        """Run code formatting and style checks."""
-        print("\n🎨 Running code formatting checks...")
+    def find_python_files(self, *roots: str) -> List[str]:
+        """Enumerate Python files under the given project directories.
 
-        success = True
+        Args:
+            roots: Directory names relative to the project root
 
-        # Black formatting check
-        success &= self.run_command(
-            ["black", "--check", "--diff", "debt_optimizer", "tests", "scripts"],
-            "Black code formatting check",
-        )
+        Returns:
+            Sorted list of file paths relative to the project root
+        """
+        files = []
+        for root in roots:
+            files.extend(
+                str(p.relative_to(self.project_root))
+                for p in (self.project_root / root).rglob("*.py")
+            )
+        return sorted(files)
 
-        # isort import sorting check
-        success &= self.run_command(
-            [
-                "isort",
-                "--profile",
-                "black",
-                "--check-only",
-                "--diff",
-                "debt_optimizer",
-                "tests",
-                "scripts",
-            ],
-            "isort import sorting check",
-        )
+    def _run_check(self, cmd: List[str], description: str):
+        """Run a single check with captured output.
 
-        # Flake8 linting
-        success &= self.run_command(
-            [
-                "flake8",
-                "debt_optimizer",
-                "tests",
-                "--count",
-                "--select=E9,F63,F7,F82",
-                "--show-source",
-                "--statistics",
-            ],
-            "Flake8 critical error check",
-        )
+        Args:
+            cmd: Command to run as a list of strings
+            description: Human-readable description of the check
 
-        # Additional flake8 checks (warnings only)
-        self.run_command(
-            [
-                "flake8",
-                "debt_optimizer",
-                "tests",
-                "--count",
-                "--exit-zero",
-                "--max-complexity=10",
-                "--max-line-length=127",
-                "--statistics",
-            ],
-            "Flake8 style warnings",
-            allow_failure=True,
+        Returns:
+            Tuple of (ok, description, stdout, stderr)
+        """
+        result = subprocess.run(
+            cmd, cwd=self.project_root, capture_output=True, text=True
         )
+        return result.returncode == 0, description, result.stdout, result.stderr
+
+    def run_code_formatting_checks(self) -> bool:
+        """Run code formatting and style checks.
+
+        The four tools read the same files without modifying them, so they
+        run concurrently; wall time is that of the slowest single tool.
+        The file list is enumerated once here instead of letting each tool
+        re-walk the same directory trees.
+        """
+        print("\n🎨 Running code formatting checks...")
+
+        format_files = self.find_python_files("debt_optimizer", "tests", "scripts")
+        lint_files = self.find_python_files("debt_optimizer", "tests")
+
+        checks = [
+            (
+                ["black", "--check", "--diff"] + format_files,
+                "Black code formatting check",
+                False,
+            ),
+            (
+                ["isort", "--profile", "black", "--check-only", "--diff"]
+                + format_files,
+                "isort import sorting check",
+                False,
+            ),
+            (
+                [
+                    "flake8",
+                    "--count",
+                    "--select=E9,F63,F7,F82",
+                    "--show-source",
+                    "--statistics",
+                ]
+                + lint_files,
+                "Flake8 critical error check",
+                False,
+            ),
+            (
+                [
+                    "flake8",
+                    "--count",
+                    "--exit-zero",
+                    "--max-complexity=10",
+                    "--max-line-length=127",
+                    "--statistics",
+                ]
+                + lint_files,
+                "Flake8 style warnings",
+                True,
+            ),
+        ]
+
+        success = True
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [
+                executor.submit(self._run_check, cmd, description)
+                for cmd, description, _ in checks
+            ]
+            results = [future.result() for future in futures]
+
+        # Report in submission order so output stays deterministic
+        for (_, _, allow_failure), (ok, description, stdout, stderr) in zip(
+            checks, results
+        ):
+            sys.stdout.write(f"{_SEP}Running: {description}\n{_BANNER}\n")
+            if self.verbose or not ok:
+                if stdout:
+                    print(stdout)
+                if stderr:
+                    print(stderr)
+            if ok:
+                print(f"✅ {description} - PASSED")
+            else:
+                print(f"❌ {description} - FAILED")
+                if not allow_failure:
+                    self.failed_checks.append(description)
+                    success = False
 
         return success
 
@@ -196,42 +270,110 @@ class TestRunner:
                 "MyPy type checking",
             )
 
+    def _hash_files(self, paths: List[Path]) -> str:
+        """Compute a SHA-256 digest over the given files.
+
+        Args:
+            paths: Files to include in the digest
+
+        Returns:
+            Hex digest covering the file names and contents
+        """
+        digest = hashlib.sha256()
+        for path in sorted(paths):
+            digest.update(str(path).encode())
+            digest.update(path.read_bytes())
+        return digest.hexdigest()
+
+    def _load_security_cache(self) -> dict:
+        """Load the cached security-check results, if any."""
+        cache_file = self.project_root / ".release_cache" / "security.json"
+        try:
+            return json.loads(cache_file.read_text())
+        except (OSError, ValueError):
+            return {}
+
+    def _save_security_cache(self, cache: dict) -> None:
+        """Persist security-check results for the next run."""
+        cache_file = self.project_root / ".release_cache" / "security.json"
+        cache_file.parent.mkdir(exist_ok=True)
+        cache_file.write_text(json.dumps(cache, indent=2))
+
     def run_security_checks(self) -> bool:
-        """Run security vulnerability checks."""
+        """Run security vulnerability checks.
+
+        Results are cached in .release_cache/security.json. Bandit is a
+        pure function of the package sources, so it is skipped whenever
+        those are unchanged since the last green run. Safety also depends
+        on an external vulnerability database that updates daily, so its
+        cache additionally expires after _SAFETY_CACHE_TTL seconds; the
+        TTL alone forces periodic re-scans even when no requirements
+        files exist and the input hash can never change.
+        """
         print("\n🔒 Running security checks...")
 
         success = True
+        cache = self._load_security_cache()
 
         # Safety scan for known vulnerabilities (new command)
         # Scan requirements files if they exist, otherwise scan environment
-        requirements_files = []
-        if Path("requirements.txt").exists():
-            requirements_files.extend(["-r", "requirements.txt"])
-        if Path("requirements-dev.txt").exists():
-            requirements_files.extend(["-r", "requirements-dev.txt"])
+        requirements_paths = [
+            p
+            for p in (Path("requirements.txt"), Path("requirements-dev.txt"))
+            if p.exists()
+        ]
 
         safety_cmd = ["safety", "scan", "--output", "screen"]
-        if requirements_files:
-            safety_cmd.extend(requirements_files)
-            print(
-                f"   Scanning: {', '.join([f for f in requirements_files if f != '-r'])}"
-            )
+        for path in requirements_paths:
+            safety_cmd.extend(["-r", str(path)])
+        if requirements_paths:
+            print(f"   Scanning: {', '.join(str(p) for p in requirements_paths)}")
         else:
             print("   Scanning: environment")
 
-        # Safety scan should fail the build if vulnerabilities are found
-        success &= self.run_command(
-            safety_cmd,
-            "Safety vulnerability scan",
-            allow_failure=False,  # Treat vulnerabilities as build failures
+        safety_hash = self._hash_files(requirements_paths)
+        cached_safety = cache.get("safety")
+        safety_fresh = (
+            isinstance(cached_safety, dict)
+            and cached_safety.get("hash") == safety_hash
+            and time.time() - cached_safety.get("time", 0) < _SAFETY_CACHE_TTL
         )
+        if safety_fresh:
+            print("✅ Safety vulnerability scan - PASSED (cached, recent green run)")
+        else:
+            # Safety scan should fail the build if vulnerabilities are found
+            if self.run_command(
+                safety_cmd,
+                "Safety vulnerability scan",
+                allow_failure=False,  # Treat vulnerabilities as build failures
+            ):
+                cache["safety"] = {"hash": safety_hash, "time": time.time()}
+            else:
+                success = False
 
         # Bandit security linting
-        success &= self.run_command(
-            ["bandit", "-r", "debt_optimizer", "-f", "json"],
-            "Bandit security linting",
-            allow_failure=True,  # May have false positives
+        bandit_hash = self._hash_files(
+            list((self.project_root / "debt_optimizer").rglob("*.py"))
         )
+        if cache.get("bandit") == bandit_hash:
+            print("✅ Bandit security linting - PASSED (cached, inputs unchanged)")
+        else:
+            # Human-readable output by default; JSON serialization of the
+            # full result set is only worth paying for when a file report
+            # was requested.
+            bandit_cmd = ["bandit", "-r", "debt_optimizer"]
+            if self.json_output:
+                bandit_cmd.extend(["-f", "json", "-o", "bandit-report.json"])
+            if self.run_command(
+                bandit_cmd,
+                "Bandit security linting",
+                allow_failure=True,  # May have false positives
+            ):
+                cache["bandit"] = bandit_hash
+            else:
+                success = False
+
+        self._save_security_cache(cache)
 
         return success
 
@@ -270,6 +412,28 @@ class TestRunner:
             "Integration tests with coverage",
         )
 
+    def run_remaining_tests(self) -> bool:
+        """Run tests not covered by the unit/integration/slow passes.
+
+        Excel, CLI, visualization and unmarked tests carry none of those
+        three markers, so without this pass they would never run.
+        """
+        print("\n🧩 Running remaining tests...")
+
+        return self.run_command(
+            [
+                "pytest",
+                "-m",
+                "not unit and not integration and not slow",
+                "--cov=debt_optimizer",
+                "--cov-append",
+                "--cov-report=term",
+                "--cov-report=html:htmlcov/remaining",
+                "--tb=short",
+            ],
+            "Remaining tests with coverage",
+        )
+
     def run_slow_tests(self) -> bool:
         """Run slow/performance tests."""
         print("\n🐌 Running slow tests...")
@@ -297,6 +461,32 @@ class TestRunner:
             "Complete test suite with coverage",
         )
 
+    def run_coverage_report(self) -> bool:
+        """Generate combined coverage reports from previous test runs."""
+        print("\n📈 Generating combined coverage reports...")
+
+        # No-op when there are no parallel data files to merge
+        self.run_command(
+            ["coverage", "combine"],
+            "Combine coverage data",
+            allow_failure=True,
+        )
+
+        success = self.run_command(
+            ["coverage", "report", "--fail-under=75"],
+            "Coverage report (fail under 75%)",
+        )
+        success &= self.run_command(
+            ["coverage", "html", "-d", "htmlcov/all"],
+            "HTML coverage report",
+        )
+        success &= self.run_command(
+            ["coverage", "xml"],
+            "XML coverage report",
+        )
+
+        return success
+
     def run_full_test_suite(
         self, skip_slow: bool = False, skip_security: bool = False
     ) -> bool:
@@ -325,20 +515,20 @@ class TestRunner:
         if not skip_security:
             self.run_security_checks()  # Don't fail on security warnings
 
-        # Test execution
+        # Test execution; the marker passes are disjoint and the remaining
+        # pass picks up every test the first two filters exclude.
         success &= self.run_unit_tests()
         success &= self.run_integration_tests()
+        success &= self.run_remaining_tests()
 
         if not skip_slow:
             self.run_slow_tests()  # Don't fail on slow test issues
 
-        # Final comprehensive test run
-        success &= self.run_all_tests()
+        # Combined coverage reporting (tests above already ran with coverage)
+        success &= self.run_coverage_report()
 
         # Report results
-        print(f"\n{'='*60}")
-        print("📊 TEST SUITE RESULTS")
-        print("=" * 60)
+        sys.stdout.write(f"{_SEP}📊 TEST SUITE RESULTS\n{_BANNER}\n")
 
         if success:
             print("✅ ALL CRITICAL TESTS PASSED!")
@@ -368,6 +558,11 @@ def main():
         action="store_true",
         help="Skip security vulnerability checks",
     )
+    parser.add_argument(
+        "--json-output",
+        action="store_true",
+        help="Write machine-readable security reports to files",
+    )
     parser.add_argument(
         "--verbose",
         "-v",
@@ -377,12 +572,10 @@ def main():
 
     args = parser.parse_args()
 
-    # Find project root
-    current_dir = Path(__file__).resolve().parent
-    project_root = current_dir.parent
-
     # Run tests
-    runner = TestRunner(project_root, verbose=args.verbose)
+    runner = TestRunner(
+        _PROJECT_ROOT, verbose=args.verbose, json_output=args.json_output
+    )
     success = runner.run_full_test_suite(
         skip_slow=args.skip_slow, skip_security=args.skip_security
     )
@@ -1,8 +1,3 @@
-"""Module documentation for update_documentation.py.
-
-This module is part of the Financial Debt Optimizer project.
-"""
-
 #!/usr/bin/env python3
 """Documentation update script for Financial Debt Optimizer releases.
 
@@ -25,11 +20,15 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import concurrent.futures
 import datetime as dt
+import functools
 import os
 import re
+import shutil
 import subprocess
 import sys
+from dataclasses import dataclass
 from pathlib import Path
 from typing import List, Optional, Tuple
 
@@ -47,66 +46,231 @@ REPO_ROOT = Path(__file__).resolve().parents[1]
 DOC_DIRS = ["docs", "."]
 DOC_EXTS = (".md", ".rst")
 
+# Frozen lookup structures for the fallback doc scan: O(1) extension
+# membership, and directories never worth descending into
+_DOC_EXTS = frozenset(DOC_EXTS)
+_SKIP_DIRS = frozenset(
+    {
+        ".git",
+        ".venv",
+        "venv",
+        "__pycache__",
+        "node_modules",
+        "build",
+        "dist",
+        ".mypy_cache",
+        ".pytest_cache",
+        ".ruff_cache",
+        "htmlcov",
+    }
+)
+
+# Prefix for fast string-level relativization in _rel()
+_REPO_ROOT_STR = str(REPO_ROOT) + os.sep
+
+
+def _rel(p: Path) -> str:
+    """Return p relative to REPO_ROOT as a string.
+
+    String slicing instead of Path.relative_to avoids a PurePath
+    construction and prefix validation per call.
+
+    Args:
+        p: Path to relativize
+
+    Returns:
+        Repo-relative path string, or the original string if p is outside
+        the repo
+    """
+    s = str(p)
+    return s[len(_REPO_ROOT_STR):] if s.startswith(_REPO_ROOT_STR) else s
+
+
+# Bytes pattern so the docstring check can run on a raw head peek without
+# decoding the whole file
+_MODULE_DOCSTRING_RE = re.compile(rb'^\s*(?:"""|\'\'\')')
+
+# Worker count for the I/O-bound per-file loops; the GIL is released
+# during file reads/writes so threads scale until the disk saturates
+_MAX_IO_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Doc-file contents keyed by path -> (st_mtime_ns, st_size, bytes), so
+# repeated update_version_refs passes in one run stay in RAM
+_DOC_CACHE: dict = {}
+
+# Set from --dry-run in main(); collapses every write branch below so a
+# dry run is a pure scan
+DRY_RUN = False
+
+
+def _read_doc_bytes(p: Path) -> bytes:
+    """Read a doc file through the mtime/size-validated content cache.
+
+    Args:
+        p: File to read
+
+    Returns:
+        File contents as bytes
+    """
+    st = p.stat()
+    cached = _DOC_CACHE.get(p)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+    data = p.read_bytes()
+    _DOC_CACHE[p] = (st.st_mtime_ns, st.st_size, data)
+    return data
+
+
+def _write_doc_bytes(p: Path, data: bytes) -> None:
+    """Write a doc file and refresh its cache entry.
+
+    Args:
+        p: File to write
+        data: New contents
+    """
+    p.write_bytes(data)
+    st = p.stat()
+    _DOC_CACHE[p] = (st.st_mtime_ns, st.st_size, data)
+
 
 def run(
     cmd: List[str], cwd: Optional[Path] = None, check: bool = True
 ) -> subprocess.CompletedProcess:
     """Run a shell command and return the completed process.
 
+    Output is captured as bytes; callers decode only the parts they keep,
+    avoiding a full UTF-8 pass over output that is mostly discarded.
+
     Args:
         cmd: Command and arguments as list of strings
         cwd: Working directory for command (defaults to REPO_ROOT)
         check: Whether to raise exception on non-zero exit
 
     Returns:
-        CompletedProcess instance with stdout, stderr, returncode
+        CompletedProcess instance with bytes stdout/stderr and returncode
     """
     return subprocess.run(
-        cmd, cwd=str(cwd or REPO_ROOT), text=True, capture_output=True, check=check
+        cmd, cwd=str(cwd or REPO_ROOT), capture_output=True, check=check
     )
 
 
-def last_tag() -> Optional[str]:
-    """Get the most recent git tag.
+@dataclass
+class GitContext:
+    """Git state for the release, captured once at startup.
 
-    Returns:
-        Tag name (e.g., 'v2.0.1') or None if no tags exist
+    Attributes:
+        tag: Most recent tag (e.g., 'v2.0.1') or None if no tags exist
+        names: Changed paths relative to REPO_ROOT, as reported by git
+        log: Commit subjects since the tag (empty when no tag), already
+            narrowed by git to fix/improve matches and kept as raw bytes,
+            decoded only when a subject is actually used
     """
-    try:
-        cp = run(["git", "describe", "--tags", "--abbrev=0"], check=True)
-        return cp.stdout.strip()
-    except subprocess.CalledProcessError:
-        return None
 
+    tag: Optional[str]
+    names: List[str]
+    log: List[bytes]
 
-def changed_files(reference: Optional[str]) -> List[Path]:
-    """Return changed files relative to reference (tag) or uncommitted.
+    @functools.cached_property
+    def files(self) -> List[Path]:
+        """Changed files that still exist on disk (computed once per run)."""
+        return [REPO_ROOT / n for n in self.names if (REPO_ROOT / n).exists()]
 
-    Args:
-        reference: Git reference (tag/commit) to compare against, or None for uncommitted
+
+_GIT_SENTINEL = "---GITCTX---"
+
+
+def git_context() -> GitContext:
+    """Collect tag, changed files, and commit subjects in one subprocess.
+
+    The describe/diff/log calls are batched into a single shell invocation
+    with sentinel separators, replacing three to four fork/exec cycles with
+    one. A persistent ``git cat-file --batch`` worker process was considered
+    as an alternative, but with only one read-only git invocation left per
+    run a long-lived helper would cost more than it amortizes; revisit if
+    per-object queries (ref resolution, blob lookups) are ever added.
 
     Returns:
-        List of Path objects for changed files
+        Populated GitContext
     """
-    if reference:
-        cp = run(["git", "diff", "--name-only", f"{reference}..HEAD"], check=True)
-        names = [n for n in cp.stdout.splitlines() if n]
+    script = (
+        'tag=$(git describe --tags --abbrev=0 2>/dev/null); echo "$tag"; '
+        "echo {sep}; "
+        'if [ -n "$tag" ]; then git diff --name-only "$tag"..HEAD; '
+        "else git status --porcelain; fi; "
+        "echo {sep}; "
+        'if [ -n "$tag" ]; then '
+        "git log --pretty=%s -i --grep='fix\\|improve' \"$tag\"..HEAD; fi"
+    ).format(sep=_GIT_SENTINEL)
+    # Stream the pipe line-by-line: parsing overlaps git's output
+    # generation and memory stays constant regardless of history size
+    sentinel = _GIT_SENTINEL.encode("ascii")
+    sections: List[List[bytes]] = [[], [], []]
+    section = 0
+    with subprocess.Popen(
+        ["sh", "-c", script], cwd=str(REPO_ROOT), stdout=subprocess.PIPE
+    ) as proc:
+        for raw in proc.stdout:
+            line = raw.rstrip(b"\n")
+            if line == sentinel:
+                section += 1
+            elif line:
+                sections[section].append(line)
+    if proc.returncode:
+        raise subprocess.CalledProcessError(proc.returncode, script)
+
+    tag_lines, file_lines, log = sections
+    tag = tag_lines[0].decode("utf-8") if tag_lines else None
+    if tag:
+        names = [n.decode("utf-8") for n in file_lines]
     else:
-        cp = run(["git", "status", "--porcelain"], check=True)
-        names = [ln.split(maxsplit=1)[-1] for ln in cp.stdout.splitlines() if ln]
-    return [REPO_ROOT / n for n in names if (REPO_ROOT / n).exists()]
+        names = [ln.split(maxsplit=1)[-1].decode("utf-8") for ln in file_lines]
+    # Subjects stay as bytes; build_changelog_entry decodes only matches
+
+    return GitContext(tag=tag, names=names, log=log)
+
+
+def _walk_docs(base: Path):
+    """Yield paths (str) of doc files under base using os.scandir.
+
+    Recurses with an explicit stack, prunes hidden/vendored directories by
+    name before descending, and filters on the entry name so no extra
+    stat() or Path construction happens for non-doc files.
+
+    Args:
+        base: Directory to walk
+
+    Yields:
+        str paths of .md/.rst files
+    """
+    stack = [str(base)]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    name = entry.name
+                    if entry.is_dir(follow_symlinks=False):
+                        if not name.startswith(".") and name not in _SKIP_DIRS:
+                            stack.append(entry.path)
+                    elif os.path.splitext(name)[1] in _DOC_EXTS:
+                        yield entry.path
+        except PermissionError:
+            continue
 
 
 def is_python_file(p: Path) -> bool:
     """Check if path is a Python file.
 
+    Callers pass paths from GitContext.files, which already filtered on
+    existence, so this is a pure suffix check with no stat().
+
     Args:
         p: Path to check
 
     Returns:
-        True if file has .py extension and exists
+        True if file has .py extension
     """
-    return p.suffix == ".py" and p.exists()
+    return p.suffix == ".py"
 
 
 def ensure_google_docstrings(p: Path, verbose: bool = False) -> bool:
@@ -124,66 +288,162 @@ def ensure_google_docstrings(p: Path, verbose: bool = False) -> bool:
     Returns:
         True if file was modified, False otherwise
     """
-    src = p.read_text(encoding="utf-8")
-    modified = False
-
-    # Add module docstring if missing
-    if not re.match(r'^\s*("""|\'\'\')', src):
-        header = f'"""Module documentation for {p.name}.\n\nThis module is part of the Financial Debt Optimizer project.\n"""\n\n'
-        src = header + src
-        modified = True
+    # Peek at the head of the file; when a module docstring is already
+    # present we never read, decode, or allocate anything further
+    with open(p, "rb") as fh:
+        head = fh.read(256)
+    if _MODULE_DOCSTRING_RE.match(head):
+        return False
+
+    if DRY_RUN:
+        # Report that the file would change without building the header
+        return True
+
+    # Prepend the missing module docstring by streaming the original
+    # content after the header — no full-file load or decode
+    header = f'"""Module documentation for {p.name}.\n\nThis module is part of the Financial Debt Optimizer project.\n"""\n\n'
+    tmp = p.with_suffix(".py.tmp")
+    with open(tmp, "wb") as out:
+        out.write(header.encode("utf-8"))
+        with open(p, "rb") as inp:
+            shutil.copyfileobj(inp, out, length=1 << 20)
+    os.replace(tmp, p)
 
-    if verbose and modified:
+    if verbose:
         print(
-            f"{EMOJI['docs']} Updated docstrings/comments in {p.relative_to(REPO_ROOT)}"
+            f"{EMOJI['docs']} Updated docstrings/comments in {_rel(p)}"
         )
 
-    if modified:
-        p.write_text(src, encoding="utf-8")
-
-    return modified
+    return True
 
 
 def update_version_refs(old: str, new: str, verbose: bool = False) -> List[Path]:
     """Update version references in documentation files.
 
-    Searches for old version string and replaces with new in .md and .rst files.
-    Skips Python code files (version bumping is handled separately).
+    Shim that forwards to update_version_refs_map for a single pair.
 
     Args:
         old: Old version string (e.g., '2.0.1')
         new: New version string (e.g., '2.0.2')
         verbose: Whether to print progress messages
 
+    Returns:
+        List of Path objects that were modified
+    """
+    return update_version_refs_map({old: new}, verbose=verbose)
+
+
+def update_version_refs_map(mapping: dict, verbose: bool = False) -> List[Path]:
+    """Update several version references in documentation files at once.
+
+    Searches for the old version strings and replaces each with its new
+    value in .md and .rst files, in one linear pass per file. Skips Python
+    code files (version bumping is handled separately).
+
+    Args:
+        mapping: Old version string -> new version string
+        verbose: Whether to print progress messages
+
     Returns:
         List of Path objects that were modified
     """
     touched: List[Path] = []
-    for base in DOC_DIRS:
-        base_path = REPO_ROOT / base
-        if not base_path.exists():
-            continue
-        for root, _, files in os.walk(base_path):
-            for fn in files:
-                p = Path(root) / fn
-                if p.suffix in DOC_EXTS:
-                    try:
-                        text = p.read_text(encoding="utf-8")
-                        if old in text:
-                            text = text.replace(old, new)
-                            p.write_text(text, encoding="utf-8")
-                            touched.append(p)
-                            if verbose:
-                                print(
-                                    f"{EMOJI['version']} Updated version in {p.relative_to(REPO_ROOT)}"
-                                )
-                    except (UnicodeDecodeError, PermissionError):
-                        # Skip binary files or files we can't read
-                        continue
+    if not mapping:
+        return touched
+
+    # Longest-first alternation so e.g. '2.0.1rc1' is not shadowed by its
+    # '2.0.1' prefix; one compiled pattern gives a single pass per file
+    olds = sorted(mapping, key=len, reverse=True)
+    pat = re.compile(b"|".join(re.escape(old.encode("utf-8")) for old in olds))
+    replacements = {old.encode("utf-8"): new.encode("utf-8") for old, new in mapping.items()}
+
+    # Let git grep narrow to matching files before reading anything into
+    # Python; only the hits pay for a read/decode/rewrite.
+    cp = run(
+        ["git", "grep", "-lz"]
+        + [arg for old in olds for arg in ("-e", old)]
+        + ["--fixed-strings", "--", "*.md", "*.rst"],
+        check=False,
+    )
+    if cp.returncode == 0:
+        candidates = [
+            REPO_ROOT / n.decode("utf-8") for n in cp.stdout.split(b"\0") if n
+        ]
+    elif cp.returncode == 1:
+        # No tracked doc file contains the old version
+        return touched
+    else:
+        # No usable git metadata — fall back to scanning the doc dirs
+        candidates = []
+        for base in DOC_DIRS:
+            base_path = REPO_ROOT / base
+            if base_path.exists():
+                candidates.extend(Path(s) for s in _walk_docs(base_path))
+
+    # Work on raw bytes: version strings are ASCII, so the UTF-8
+    # decode/encode round-trip is pure overhead
+    def rewrite(p: Path) -> Optional[Path]:
+        try:
+            data = _read_doc_bytes(p)
+        except (PermissionError, OSError):
+            # Skip files we can't read
+            return None
+        if DRY_RUN:
+            # A match is enough to report the file; skip the rewrite
+            return p if pat.search(data) else None
+        new_data = pat.sub(lambda m: replacements[m.group(0)], data)
+        if new_data == data:
+            return None
+        _write_doc_bytes(p, new_data)
+        return p
+
+    # Each file is independent read-check-maybe-write work, so fan out
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=_MAX_IO_WORKERS
+    ) as executor:
+        touched = [p for p in executor.map(rewrite, candidates) if p]
+
+    if verbose:
+        for p in touched:
+            print(f"{EMOJI['version']} Updated version in {_rel(p)}")
     return touched
 
 
-def build_changelog_entry(version: str, reference: Optional[str]) -> str:
+# Precompiled changelog classification rules tailored to this project's
+# file structure: (predicate over a repo-relative path, Fixed message,
+# optional Improved message)
+_FILE_RULES: Tuple = (
+    (
+        re.compile(r"visualization/charts\.py$").search,
+        "Fixed deprecated matplotlib colormap API usage (matplotlib.cm.get_cmap → matplotlib.colormaps.get_cmap).",
+        None,
+    ),
+    (
+        lambda f: f.endswith(
+            (
+                "cli/commands.py",
+                "excel_io/excel_reader.py",
+                "excel_io/excel_writer.py",
+            )
+        )
+        or f == "setup.py",
+        "Fixed import paths to use absolute package imports and corrected CLI entry point.",
+        None,
+    ),
+    (
+        re.compile(r"balance_updater\.py").search,
+        "Fixed balance updater SQL to match Quicken register balance including reconciled and dated unreconciled transactions; improved date handling.",
+        "Enhanced balance calculation logic with accurate date handling and query structure.",
+    ),
+    (
+        lambda f: "debt_optimizer.py" in f and "core/" in f,
+        "Fixed cash flow over-reserving when same-day income covers payments/expenses; corrected monthly surplus display.",
+        "Improved monthly surplus calculations by properly accounting for same-day income.",
+    ),
+)
+
+
+def build_changelog_entry(version: str, ctx: GitContext) -> str:
     """Build CHANGELOG entry from git history.
 
     Analyzes commits and changed files to categorize changes into Fixed and Improved
@@ -191,70 +451,41 @@ def build_changelog_entry(version: str, reference: Optional[str]) -> str:
 
     Args:
         version: New version number (e.g., '2.0.2')
-        reference: Git reference to compare against, or None
+        ctx: Git context captured at startup
 
     Returns:
         Formatted changelog entry string with sections
     """
     today = dt.date.today().isoformat()
 
-    # Collect diffs/commits
-    if reference:
-        cp = run(["git", "diff", "--name-only", f"{reference}..HEAD"], check=True)
-        files = cp.stdout.splitlines()
-        cp = run(["git", "log", "--pretty=%s", f"{reference}..HEAD"], check=True)
-        log = cp.stdout.splitlines()
-    else:
-        files = [str(p.relative_to(REPO_ROOT)) for p in changed_files(None)]
-        log = []
+    # Diffs/commits were already collected at startup
+    files = ctx.names
+    log = ctx.log
 
     fixed: List[str] = []
     improved: List[str] = []
 
     # Heuristics tailored to known changes plus generic fallbacks
     for f in files:
-        if "visualization/charts.py" in f:
-            fixed.append(
-                "Fixed deprecated matplotlib colormap API usage (matplotlib.cm.get_cmap → matplotlib.colormaps.get_cmap)."
-            )
-        if (
-            f.endswith(
-                (
-                    "cli/commands.py",
-                    "excel_io/excel_reader.py",
-                    "excel_io/excel_writer.py",
-                )
-            )
-            or f == "setup.py"
-        ):
-            fixed.append(
-                "Fixed import paths to use absolute package imports and corrected CLI entry point."
-            )
-        if "balance_updater.py" in f:
-            fixed.append(
-                "Fixed balance updater SQL to match Quicken register balance including reconciled and dated unreconciled transactions; improved date handling."
-            )
-            improved.append(
-                "Enhanced balance calculation logic with accurate date handling and query structure."
-            )
-        if "debt_optimizer.py" in f and "core/" in f:
-            fixed.append(
-                "Fixed cash flow over-reserving when same-day income covers payments/expenses; corrected monthly surplus display."
-            )
-            improved.append(
-                "Improved monthly surplus calculations by properly accounting for same-day income."
-            )
+        for pred, fix_msg, improve_msg in _FILE_RULES:
+            if pred(f):
+                fixed.append(fix_msg)
+                if improve_msg:
+                    improved.append(improve_msg)
 
-    # Fallbacks from commit subjects
+    # Fallbacks from commit subjects; only matching subjects are decoded
     for s in log:
-        if "fix" in s.lower() and s not in fixed:
-            fixed.append(s.rstrip(".") + ".")
-        if "improve" in s.lower() and s not in improved:
-            improved.append(s.rstrip(".") + ".")
-
-    # Remove duplicates and sort
-    fixed = sorted(set(fixed))
-    improved = sorted(set(improved))
+        low = s.lower()
+        if b"fix" in low or b"improve" in low:
+            subject = s.decode("utf-8", errors="replace").rstrip(".") + "."
+            if b"fix" in low and subject not in fixed:
+                fixed.append(subject)
+            if b"improve" in low and subject not in improved:
+                improved.append(subject)
+
+    # Deduplicate preserving insertion order (O(N) vs sorted-set O(N log N))
+    fixed = list(dict.fromkeys(fixed))
+    improved = list(dict.fromkeys(improved))
 
     # Build entry
     parts = [f"## [{version}] - {today}"]
@@ -269,27 +500,36 @@ def build_changelog_entry(version: str, reference: Optional[str]) -> str:
     return "\n".join(parts)
 
 
-def update_changelog(
-    version: str, reference: Optional[str], verbose: bool = False
-) -> Path:
+def update_changelog(version: str, ctx: GitContext, verbose: bool = False) -> Path:
     """Update CHANGELOG.md with new version entry.
 
     Prepends new changelog entry to existing CHANGELOG.md or creates new file.
 
     Args:
         version: New version number (e.g., '2.0.2')
-        reference: Git reference to compare against, or None
+        ctx: Git context captured at startup
         verbose: Whether to print progress messages
 
     Returns:
         Path to CHANGELOG.md
     """
-    entry = build_changelog_entry(version, reference)
+    entry = build_changelog_entry(version, ctx)
     p = REPO_ROOT / "CHANGELOG.md"
 
+    if DRY_RUN:
+        # Preview only — never touch the changelog on a dry run
+        return p
+
     if p.exists():
-        current = p.read_text(encoding="utf-8")
-        p.write_text(entry + "\n" + current, encoding="utf-8")
+        # Prepend by streaming the old content after the new entry with a
+        # bounded buffer, then rename atomically — memory use stays
+        # independent of changelog size
+        tmp = p.with_suffix(".md.tmp")
+        with open(tmp, "wb") as out:
+            out.write(entry.encode("utf-8") + b"\n")
+            with open(p, "rb") as inp:
+                shutil.copyfileobj(inp, out, length=1 << 20)
+        os.replace(tmp, p)
     else:
         p.write_text("# Changelog\n\n" + entry, encoding="utf-8")
 
@@ -322,25 +562,37 @@ def main() -> int:
     )
     args = parser.parse_args()
 
+    global DRY_RUN
+    DRY_RUN = args.dry_run
+
     print(f"{EMOJI['run']} Updating documentation to {args.to_version}")
 
     # Determine scope: use last tag if available, otherwise uncommitted changes
-    tag = last_tag()
-    reference = tag if tag else None
+    ctx = git_context()
 
-    if reference:
-        print(f"  Analyzing changes since {reference}")
+    if ctx.tag:
+        print(f"  Analyzing changes since {ctx.tag}")
     else:
         print("  Analyzing uncommitted changes")
 
-    # Analyze Python files for documentation quality
-    py_files = [p for p in changed_files(reference) if is_python_file(p)]
-    if args.verbose:
-        print(f"\n{EMOJI['scan']} Found {len(py_files)} Python files to analyze")
-
-    modified_any = False
-    for p in py_files:
-        modified_any |= ensure_google_docstrings(p, verbose=args.verbose)
+    # Analyze Python files for documentation quality; skip the pass (and
+    # its header) outright when no Python files changed
+    py_files = [p for p in ctx.files if is_python_file(p)]
+
+    touched_paths: set = set()
+    if py_files:
+        if args.verbose:
+            print(f"\n{EMOJI['scan']} Found {len(py_files)} Python files to analyze")
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=_MAX_IO_WORKERS
+        ) as executor:
+            results = list(
+                executor.map(
+                    lambda p: ensure_google_docstrings(p, verbose=args.verbose),
+                    py_files,
+                )
+            )
+        touched_paths.update(p for p, modified in zip(py_files, results) if modified)
 
     # Update version references in docs
     doc_touched = []
@@ -348,6 +600,7 @@ def main() -> int:
         doc_touched = update_version_refs(
             args.from_version, args.to_version, verbose=args.verbose
         )
+        touched_paths.update(doc_touched)
         if args.verbose and doc_touched:
             print(
                 f"\n{EMOJI['version']} Updated version in {len(doc_touched)} doc files"
@@ -356,7 +609,8 @@ def main() -> int:
     # Update changelog
     if args.verbose:
         print(f"\n{EMOJI['changelog']} Generating CHANGELOG entry...")
-    chg = update_changelog(args.to_version, reference, verbose=args.verbose)
+    chg = update_changelog(args.to_version, ctx, verbose=args.verbose)
+    touched_paths.add(chg)
 
     if args.dry_run:
         print(f"\n{EMOJI['ok']} Dry-run complete. No changes written.")
@@ -365,24 +619,66 @@ def main() -> int:
         print(f"  Would prepend entry to CHANGELOG.md")
         return 0
 
-    # Format with Black
-    print(f"\n🎨 Formatting code with Black...")
-    try:
-        cp = run([sys.executable, "-m", "black", ".", "--quiet"], check=True)
-    except subprocess.CalledProcessError as e:
-        print(f"{EMOJI['fail']} Black formatting failed: {e.stderr}", file=sys.stderr)
-        return e.returncode
+    if not touched_paths:
+        print(f"\n{EMOJI['ok']} Nothing changed; skipping format and commit.")
+        return 0
+
+    # Format with Black — only the Python files this script touched, not
+    # the whole repo. Prefer in-process black.format_str, which pays the
+    # import once instead of a child interpreter startup per release.
+    py_touched = sorted(p for p in touched_paths if p.suffix == ".py")
+    if py_touched:
+        print(f"\n🎨 Formatting code with Black...")
+        try:
+            import black
+        except ImportError:
+            black = None
+
+        if black is not None:
+            mode = black.Mode()
+            try:
+                for p in py_touched:
+                    src = p.read_text(encoding="utf-8")
+                    formatted = black.format_str(src, mode=mode)
+                    if formatted != src:
+                        p.write_text(formatted, encoding="utf-8")
+            except black.InvalidInput as e:
+                print(
+                    f"{EMOJI['fail']} Black formatting failed: {e}", file=sys.stderr
+                )
+                return 1
+        else:
+            # Black lives in another interpreter — fall back to a subprocess
+            try:
+                run(
+                    [sys.executable, "-m", "black", "--quiet", "--fast"]
+                    + [str(p) for p in py_touched],
+                    check=True,
+                )
+            except subprocess.CalledProcessError as e:
+                print(
+                    f"{EMOJI['fail']} Black formatting failed: "
+                    f"{e.stderr.decode('utf-8', errors='replace')}",
+                    file=sys.stderr,
+                )
+                return e.returncode
 
     # Commit changes
     print(f"\n💾 Committing documentation updates...")
     try:
-        run(["git", "add", "--all"], check=True)
+        # Targeted paths in one invocation — no full worktree rescan
+        rel_paths = sorted(_rel(p) for p in touched_paths)
+        run(["git", "add", "--"] + rel_paths, check=True)
         msg = f"docs: update docstrings/comments; update version refs to {args.to_version}; add CHANGELOG for {args.to_version}"
         run(["git", "commit", "-m", msg], check=True)
         print(f"{EMOJI['ok']} Documentation updated and committed.")
         return 0
     except subprocess.CalledProcessError as e:
-        print(f"{EMOJI['fail']} Git commit failed: {e.stderr}", file=sys.stderr)
+        print(
+            f"{EMOJI['fail']} Git commit failed: "
+            f"{e.stderr.decode('utf-8', errors='replace')}",
+            file=sys.stderr,
+        )
         return e.returncode
 
 
@@ -2,9 +2,15 @@
 Shared pytest fixtures and configuration for Financial Debt Optimizer tests.
 """
 
+# Select the non-interactive backend once, before any test module imports
+# pyplot, so per-file backend switching is unnecessary.
+import matplotlib
+
+matplotlib.use("Agg")
+
 # Add debt_optimizer to Python path for testing
-import sys
-from pathlib import Path
+import sys  # noqa: E402
+from pathlib import Path  # noqa: E402
 
 src_path = Path(__file__).parent.parent / "debt_optimizer"
 sys.path.insert(0, str(src_path))
@@ -149,6 +155,12 @@ def pytest_configure(config):
     config.addinivalue_line("markers", "visualization: mark test as visualization test")
     config.addinivalue_line("markers", "unit: mark test as unit test")
     config.addinivalue_line("markers", "excel: mark test as Excel file operation test")
+    config.addinivalue_line(
+        "markers", "quick: mark test as a fast smoke test (select with -m quick)"
+    )
+    config.addinivalue_line(
+        "markers", "xdist_group(name): group tests onto one pytest-xdist worker"
+    )
 
     # Ensure test output directory exists
     test_output_dir = Path(__file__).parent / "test_output"
@@ -1,27 +1,66 @@
 """Tests for balance_updater module."""
 
+import copy
+import io
+import shutil
 import sqlite3
-import tempfile
+import types
 from datetime import datetime
 from pathlib import Path
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import Mock, patch
 
 import openpyxl
 import pytest
 
+from debt_optimizer.core import balance_updater as balance_updater_module
 from debt_optimizer.core.balance_updater import (
     BalanceUpdater,
     BalanceUpdaterError,
 )
 
 
-@pytest.fixture
-def temp_db():
-    """Create temporary Quicken-like SQLite database."""
-    with tempfile.NamedTemporaryFile(suffix=".sqlite", delete=False) as f:
-        db_path = Path(f.name)
+# openpyxl warns about stylistic quirks (missing default styles etc.) on
+# every load; skip the warnings machinery for the whole module. The
+# xdist_group keeps the module on one worker under `pytest -n auto` so
+# the session-scoped database and workbook fixtures are built once.
+pytestmark = [
+    pytest.mark.filterwarnings("ignore::UserWarning"),
+    pytest.mark.xdist_group(name="balance_updater"),
+]
+
+# Shared-cache in-memory database; it stays alive for as long as the
+# session-scoped keeper connection in `temp_db` is open.
+_DB_URI = "file:debt_test_db?mode=memory&cache=shared"
+
+
+@pytest.fixture(scope="session")
+def temp_db(tmp_path_factory):
+    """Create a session-wide Quicken-like SQLite database in memory.
+
+    The database lives in SQLite's shared cache so setup is pure RAM work
+    (no journal files or fsyncs). BalanceUpdater's Path-based API still
+    needs a file that exists, so this fixture yields an empty placeholder
+    path; the module-scoped `_route_connect_db` fixture points
+    ``connect_db`` at the in-memory URI while this module's tests run.
 
-    conn = sqlite3.connect(db_path)
+    No test in this module mutates the database, so the schema creation
+    and seed inserts are paid once per session instead of once per test.
+    Tests that ever need to write should use the `db_transaction` fixture
+    for rollback isolation.
+    """
+    db_path = tmp_path_factory.mktemp("db") / "quicken.sqlite"
+    db_path.touch()  # satisfies BalanceUpdater's exists() check
+
+    # isolation_level=None gives explicit transaction control instead of
+    # the sqlite3 module's implicit BEGIN-on-first-DML bookkeeping.
+    conn = sqlite3.connect(_DB_URI, uri=True, isolation_level=None)
+    # Throwaway database: disable all durability machinery up front
+    conn.executescript(
+        "PRAGMA journal_mode=OFF;"
+        "PRAGMA synchronous=OFF;"
+        "PRAGMA temp_store=MEMORY;"
+    )
+    conn.execute("BEGIN IMMEDIATE")
     cur = conn.cursor()
 
     # Create tables matching Quicken schema
@@ -51,54 +90,76 @@ def temp_db():
     """
     )
 
-    # Insert test accounts
-    cur.execute(
+    # Insert test accounts in one prepared statement
+    cur.executemany(
         """
         INSERT INTO ZACCOUNT (Z_PK, ZNAME, ZTYPENAME, ZACTIVE, ZONLINEBANKINGLEDGERBALANCEAMOUNT)
-        VALUES (1, 'PECU Checking', 'CHECKING', 1, 5000.00)
-    """
+        VALUES (?, ?, ?, ?, ?)
+    """,
+        [
+            (1, "PECU Checking", "CHECKING", 1, 5000.00),
+            (2, "Chase Freedom", "CREDITCARD", 1, -1500.00),
+            (3, "Ally Savings", "SAVINGS", 1, 10000.00),
+            (4, "Inactive Account", "CHECKING", 0, 100.00),
+        ],
     )
 
-    cur.execute(
-        """
-        INSERT INTO ZACCOUNT (Z_PK, ZNAME, ZTYPENAME, ZACTIVE, ZONLINEBANKINGLEDGERBALANCEAMOUNT)
-        VALUES (2, 'Chase Freedom', 'CREDITCARD', 1, -1500.00)
-    """
-    )
-
-    cur.execute(
-        """
-        INSERT INTO ZACCOUNT (Z_PK, ZNAME, ZTYPENAME, ZACTIVE, ZONLINEBANKINGLEDGERBALANCEAMOUNT)
-        VALUES (3, 'Ally Savings', 'SAVINGS', 1, 10000.00)
-    """
-    )
+    conn.execute("COMMIT")
 
-    cur.execute(
-        """
-        INSERT INTO ZACCOUNT (Z_PK, ZNAME, ZTYPENAME, ZACTIVE, ZONLINEBANKINGLEDGERBALANCEAMOUNT)
-        VALUES (4, 'Inactive Account', 'CHECKING', 0, 100.00)
-    """
-    )
+    yield db_path
 
-    conn.commit()
+    # Dropping the keeper connection discards the in-memory database.
     conn.close()
 
-    yield db_path
 
-    db_path.unlink()
+@pytest.fixture(scope="module", autouse=True)
+def _route_connect_db(temp_db):
+    """Point ``connect_db`` at the in-memory database for this module only.
+
+    Module-scoped rather than applied around the session-scoped
+    `temp_db` yield, so the patch is undone when this module finishes
+    and cannot leak into other modules that construct a BalanceUpdater
+    later in the same session.
+    """
+    with patch.object(
+        BalanceUpdater,
+        "connect_db",
+        lambda self: sqlite3.connect(_DB_URI, uri=True),
+    ):
+        yield
+
+
+@pytest.fixture(autouse=True)
+def _force_has_fuzz(monkeypatch):
+    """Pretend the fuzzy matching library is installed for every test."""
+    monkeypatch.setattr("debt_optimizer.core.balance_updater.HAS_FUZZ", True)
 
 
 @pytest.fixture
-def temp_xlsx():
-    """Create temporary Excel workbook."""
-    with tempfile.NamedTemporaryFile(suffix=".xlsx", delete=False) as f:
-        xlsx_path = Path(f.name)
+def db_transaction(temp_db):
+    """Open a connection to the session database inside a transaction.
+
+    Yields the connection and rolls back afterwards, so tests can mutate
+    the shared database without affecting each other.
+    """
+    conn = sqlite3.connect(_DB_URI, uri=True)
+    conn.execute("BEGIN")
+    yield conn
+    conn.rollback()
+    conn.close()
 
-    wb = openpyxl.Workbook()
+
+@pytest.fixture(scope="session")
+def _xlsx_template_path(tmp_path_factory):
+    """Build the test workbook once per session as a copy template."""
+    xlsx_path = tmp_path_factory.mktemp("xlsx") / "template.xlsx"
+
+    # Write-only mode streams rows straight to XML; fine here because the
+    # template is only ever reloaded, never edited in place.
+    wb = openpyxl.Workbook(write_only=True)
 
     # Create Debts sheet
-    ws_debts = wb.active
-    ws_debts.title = "Debts"
+    ws_debts = wb.create_sheet("Debts")
     ws_debts.append(["Account", "Balance", "Rate", "Min Payment"])
     ws_debts.append(["Chase Freedom Card", 1000.00, 18.99, 25])
     ws_debts.append(["Discover IT", 500.00, 15.99, 20])
@@ -112,20 +173,70 @@ def temp_xlsx():
     wb.save(xlsx_path)
     wb.close()
 
-    yield xlsx_path
+    return xlsx_path
+
+
+@pytest.fixture
+def temp_xlsx(_xlsx_template_path, tmp_path):
+    """Provide a per-test copy of the session workbook template.
+
+    A byte-for-byte copy is far cheaper than rebuilding and re-zipping the
+    workbook with openpyxl for every test; tmp_path handles cleanup.
+    """
+    xlsx_path = tmp_path / "wb.xlsx"
+    shutil.copyfile(_xlsx_template_path, xlsx_path)
+    return xlsx_path
+
+
+@pytest.fixture(scope="session")
+def _xlsx_template_bytes(_xlsx_template_path):
+    """Raw bytes of the session workbook template for in-memory loads."""
+    return _xlsx_template_path.read_bytes()
 
-    xlsx_path.unlink()
+
+@pytest.fixture(scope="session")
+def _template_workbook(_xlsx_template_bytes):
+    """Parse the template workbook once; handed out only as deep copies."""
+    return openpyxl.load_workbook(io.BytesIO(_xlsx_template_bytes))
 
 
 @pytest.fixture
-def mock_fuzz_library():
-    """Mock fuzzy matching library."""
+def template_wb(_template_workbook):
+    """Provide a fresh mutable copy of the parsed template workbook.
+
+    Deep-copying the tiny object graph is several times cheaper than
+    re-parsing the zipped XML for every test, and tests that never save
+    back to disk need neither a file copy nor a filesystem round trip.
+    """
+    return copy.deepcopy(_template_workbook)
+
+
+@pytest.fixture(scope="session")
+def updater(temp_db):
+    """Share one default-configured BalanceUpdater across read-only tests.
+
+    Construction stats the database path, so tests that never touch
+    updater state reuse this instance; tests needing custom constructor
+    arguments still build their own.
+    """
     with patch("debt_optimizer.core.balance_updater.HAS_FUZZ", True):
-        with patch("debt_optimizer.core.balance_updater.fuzz") as mock_fuzz:
-            with patch("debt_optimizer.core.balance_updater.process") as mock_process:
-                mock_fuzz.ratio = Mock(return_value=85)
-                mock_process.extractOne = Mock(return_value=("Chase Freedom", 85, 0))
-                yield mock_fuzz, mock_process
+        return BalanceUpdater(temp_db)
+
+
+@pytest.fixture
+def mock_extract(monkeypatch):
+    """Stub the fuzzy-match backend with a configurable Mock.
+
+    The module's ``process`` binding is swapped for a plain namespace so
+    no dotted-path resolution or third-party module is touched; tests
+    set ``mock_extract.return_value`` instead of stacking nested
+    ``with patch(...)`` blocks around the call under test.
+    """
+    stub = Mock(return_value=("Chase Freedom", 85, 0))
+    monkeypatch.setattr(
+        balance_updater_module, "process", types.SimpleNamespace(extractOne=stub)
+    )
+    return stub
 
 
 class TestBalanceUpdaterInit:
@@ -133,12 +244,11 @@ class TestBalanceUpdaterInit:
 
     def test_init_success(self, temp_db):
         """Test successful initialization."""
-        with patch("debt_optimizer.core.balance_updater.HAS_FUZZ", True):
-            updater = BalanceUpdater(temp_db)
-            assert updater.db_path == temp_db
-            assert updater.fuzzy_threshold == 80
-            assert updater.bank_account_name == "PECU Checking"
-            assert updater.auto_backup is True
+        updater = BalanceUpdater(temp_db)
+        assert updater.db_path == temp_db
+        assert updater.fuzzy_threshold == 80
+        assert updater.bank_account_name == "PECU Checking"
+        assert updater.auto_backup is True
 
     def test_init_missing_fuzz_library(self, temp_db):
         """Test initialization fails without fuzzy library."""
@@ -148,537 +258,515 @@ class TestBalanceUpdaterInit:
 
     def test_init_db_not_found(self):
         """Test initialization fails with missing database."""
-        with patch("debt_optimizer.core.balance_updater.HAS_FUZZ", True):
-            with pytest.raises(FileNotFoundError, match="Quicken database not found"):
-                BalanceUpdater(Path("/nonexistent/db.sqlite"))
+        with pytest.raises(FileNotFoundError, match="Quicken database not found"):
+            BalanceUpdater(Path("/nonexistent/db.sqlite"))
 
     def test_init_custom_params(self, temp_db):
         """Test initialization with custom parameters."""
-        with patch("debt_optimizer.core.balance_updater.HAS_FUZZ", True):
-            updater = BalanceUpdater(
-                temp_db,
-                fuzzy_threshold=90,
-                bank_account_name="Custom Bank",
-                auto_backup=False,
-            )
-            assert updater.fuzzy_threshold == 90
-            assert updater.bank_account_name == "Custom Bank"
-            assert updater.auto_backup is False
+        updater = BalanceUpdater(
+            temp_db,
+            fuzzy_threshold=90,
+            bank_account_name="Custom Bank",
+            auto_backup=False,
+        )
+        assert updater.fuzzy_threshold == 90
+        assert updater.bank_account_name == "Custom Bank"
+        assert updater.auto_backup is False
 
 
 class TestBalanceUpdaterBackup:
     """Test backup functionality."""
 
-    def test_backup_excel(self, temp_db, temp_xlsx):
+    def test_backup_excel(self, updater, temp_xlsx):
         """Test Excel backup creation."""
-        with patch("debt_optimizer.core.balance_updater.HAS_FUZZ", True):
-            updater = BalanceUpdater(temp_db)
-            backup_path = updater.backup_excel(temp_xlsx)
+        backup_path = updater.backup_excel(temp_xlsx)
 
-            assert backup_path.exists()
-            assert ".backup." in backup_path.name
-            assert temp_xlsx.stem in backup_path.name
+        assert backup_path.exists()
+        assert ".backup." in backup_path.name
+        assert temp_xlsx.stem in backup_path.name
 
-            backup_path.unlink()
+        backup_path.unlink()
 
 
 class TestBalanceUpdaterDatabase:
     """Test database operations."""
 
-    def test_connect_db(self, temp_db):
+    def test_connect_db(self, updater):
         """Test database connection."""
-        with patch("debt_optimizer.core.balance_updater.HAS_FUZZ", True):
-            updater = BalanceUpdater(temp_db)
-            conn = updater.connect_db()
+        conn = updater.connect_db()
 
-            assert isinstance(conn, sqlite3.Connection)
-            conn.close()
+        assert isinstance(conn, sqlite3.Connection)
+        conn.close()
 
-    def test_load_quicken_balances(self, temp_db):
+    def test_load_quicken_balances(self, updater):
         """Test loading balances from Quicken database."""
-        with patch("debt_optimizer.core.balance_updater.HAS_FUZZ", True):
-            updater = BalanceUpdater(temp_db)
-            accounts, credit_cards, checking, savings = updater.load_quicken_balances()
+        accounts, credit_cards, checking, savings = updater.load_quicken_balances()
 
-            # Verify account data
-            assert "PECU Checking" in accounts
-            assert "Chase Freedom" in accounts
-            assert "Ally Savings" in accounts
-            assert "Inactive Account" not in accounts  # Inactive accounts excluded
+        # Verify account data
+        assert "PECU Checking" in accounts
+        assert "Chase Freedom" in accounts
+        assert "Ally Savings" in accounts
+        assert "Inactive Account" not in accounts  # Inactive accounts excluded
 
-            # Verify balances
-            assert accounts["PECU Checking"]["balance"] == 5000.00
-            assert accounts["Chase Freedom"]["balance"] == -1500.00
-            assert accounts["Ally Savings"]["balance"] == 10000.00
+        # Verify balances
+        assert accounts["PECU Checking"]["balance"] == 5000.00
+        assert accounts["Chase Freedom"]["balance"] == -1500.00
+        assert accounts["Ally Savings"]["balance"] == 10000.00
 
-            # Verify account types
-            assert accounts["PECU Checking"]["type"] == "CHECKING"
-            assert accounts["Chase Freedom"]["type"] == "CREDITCARD"
-            assert accounts["Ally Savings"]["type"] == "SAVINGS"
+        # Verify account types
+        assert accounts["PECU Checking"]["type"] == "CHECKING"
+        assert accounts["Chase Freedom"]["type"] == "CREDITCARD"
+        assert accounts["Ally Savings"]["type"] == "SAVINGS"
 
-            # Verify categorization
-            assert "Chase Freedom" in credit_cards
-            assert "PECU Checking" in checking
-            assert "Ally Savings" in savings
+        # Verify categorization
+        assert "Chase Freedom" in credit_cards
+        assert "PECU Checking" in checking
+        assert "Ally Savings" in savings
 
 
 class TestBalanceUpdaterPrompt:
     """Test user prompt functionality."""
 
-    def test_prompt_yes_no_default_no(self, temp_db):
+    def test_prompt_yes_no_default_no(self, updater):
         """Test prompt with default no."""
-        with patch("debt_optimizer.core.balance_updater.HAS_FUZZ", True):
-            updater = BalanceUpdater(temp_db)
-
-            with patch("builtins.input", return_value=""):
-                result = updater._prompt_yes_no("Continue?", default_no=True)
-                assert result is False
+        with patch("builtins.input", return_value=""):
+            result = updater._prompt_yes_no("Continue?", default_no=True)
+            assert result is False
 
-    def test_prompt_yes_no_default_yes(self, temp_db):
+    def test_prompt_yes_no_default_yes(self, updater):
         """Test prompt with default yes."""
-        with patch("debt_optimizer.core.balance_updater.HAS_FUZZ", True):
-            updater = BalanceUpdater(temp_db)
+        with patch("builtins.input", return_value=""):
+            result = updater._prompt_yes_no("Continue?", default_no=False)
+            assert result is True
 
-            with patch("builtins.input", return_value=""):
-                result = updater._prompt_yes_no("Continue?", default_no=False)
-                assert result is True
-
-    def test_prompt_yes_no_explicit_yes(self, temp_db):
+    @pytest.mark.parametrize("answer", ["y", "Y", "yes", "YES"])
+    def test_prompt_yes_no_explicit_yes(self, updater, answer):
         """Test prompt with explicit yes."""
-        with patch("debt_optimizer.core.balance_updater.HAS_FUZZ", True):
-            updater = BalanceUpdater(temp_db)
-
-            for answer in ["y", "Y", "yes", "YES"]:
-                with patch("builtins.input", return_value=answer):
-                    result = updater._prompt_yes_no("Continue?")
-                    assert result is True
+        with patch("builtins.input", return_value=answer):
+            result = updater._prompt_yes_no("Continue?")
+            assert result is True
 
-    def test_prompt_yes_no_explicit_no(self, temp_db):
+    @pytest.mark.parametrize("answer", ["n", "N", "no", "NO"])
+    def test_prompt_yes_no_explicit_no(self, updater, answer):
         """Test prompt with explicit no."""
-        with patch("debt_optimizer.core.balance_updater.HAS_FUZZ", True):
-            updater = BalanceUpdater(temp_db)
+        with patch("builtins.input", return_value=answer):
+            result = updater._prompt_yes_no("Continue?")
+            assert result is False
 
-            for answer in ["n", "N", "no", "NO"]:
-                with patch("builtins.input", return_value=answer):
-                    result = updater._prompt_yes_no("Continue?")
-                    assert result is False
-
-    def test_prompt_yes_no_eof(self, temp_db):
+    def test_prompt_yes_no_eof(self, updater):
         """Test prompt with EOF."""
-        with patch("debt_optimizer.core.balance_updater.HAS_FUZZ", True):
-            updater = BalanceUpdater(temp_db)
+        with patch("builtins.input", side_effect=EOFError):
+            result = updater._prompt_yes_no("Continue?", default_no=True)
+            assert result is False
+
+    _PROPOSALS = [
+        (2, "Chase Card", 100.0, "Chase Freedom", 85),
+        (3, "Cap One", 200.0, "Capital One", 90),
+    ]
+
+    @pytest.mark.parametrize(
+        "answer,expected",
+        [
+            ("", set()),
+            ("none", set()),
+            ("all", {1, 2}),
+            ("1", {1}),
+            ("1, 2", {1, 2}),
+            ("2,9,x", {2}),  # out-of-range and junk entries ignored
+        ],
+    )
+    def test_prompt_match_selection(self, updater, answer, expected):
+        """Test parsing of the batched match-selection answer."""
+        with patch("builtins.input", return_value=answer):
+            assert updater._prompt_match_selection(self._PROPOSALS) == expected
 
-            with patch("builtins.input", side_effect=EOFError):
-                result = updater._prompt_yes_no("Continue?", default_no=True)
-                assert result is False
+    def test_prompt_match_selection_eof(self, updater):
+        """Test batched selection defaults to none on EOF."""
+        with patch("builtins.input", side_effect=EOFError):
+            assert updater._prompt_match_selection(self._PROPOSALS) == set()
 
 
 class TestBalanceUpdaterUpdateDebts:
     """Test debt update functionality."""
 
-    def test_update_debts_exact_match(self, temp_db, temp_xlsx):
+    def test_update_debts_exact_match(self, temp_db, template_wb):
         """Test updating debts with exact match."""
-        with patch("debt_optimizer.core.balance_updater.HAS_FUZZ", True):
-            updater = BalanceUpdater(temp_db)
+        updater = BalanceUpdater(temp_db)
 
-            wb = openpyxl.load_workbook(temp_xlsx)
-            ws = wb["Debts"]
-            ws.cell(row=2, column=1).value = "Chase Freedom"
-            ws.cell(row=2, column=2).value = 1000.00
+        wb = template_wb
+        ws = wb["Debts"]
+        ws.cell(row=2, column=1).value = "Chase Freedom"
+        ws.cell(row=2, column=2).value = 1000.00
 
-            accounts = {
-                "Chase Freedom": {"id": 1, "type": "CREDITCARD", "balance": -1500.00}
-            }
-            credit_cards = ["Chase Freedom"]
+        accounts = {
+            "Chase Freedom": {"id": 1, "type": "CREDITCARD", "balance": -1500.00}
+        }
+        credit_cards = ["Chase Freedom"]
 
-            updates = updater.update_debts_sheet(ws, accounts, credit_cards)
+        updates = updater.update_debts_sheet(ws, accounts, credit_cards)
 
-            assert len(updates) == 1
-            assert updates[0]["auto"] is True
-            assert updates[0]["score"] == 100
-            assert updates[0]["new_balance"] == 1500.00
-            assert ws.cell(row=2, column=2).value == 1500.00
+        assert len(updates) == 1
+        assert updates[0]["auto"] is True
+        assert updates[0]["score"] == 100
+        assert updates[0]["new_balance"] == 1500.00
+        assert ws.cell(row=2, column=2).value == 1500.00
 
-    def test_update_debts_no_change(self, temp_db, temp_xlsx):
+    def test_update_debts_no_change(self, temp_db, template_wb):
         """Test updating debts when balance hasn't changed."""
-        with patch("debt_optimizer.core.balance_updater.HAS_FUZZ", True):
-            updater = BalanceUpdater(temp_db)
+        updater = BalanceUpdater(temp_db)
 
-            wb = openpyxl.load_workbook(temp_xlsx)
-            ws = wb["Debts"]
-            ws.cell(row=2, column=1).value = "Chase Freedom"
-            ws.cell(row=2, column=2).value = 1500.00
+        wb = template_wb
+        ws = wb["Debts"]
+        ws.cell(row=2, column=1).value = "Chase Freedom"
+        ws.cell(row=2, column=2).value = 1500.00
 
-            accounts = {
-                "Chase Freedom": {"id": 1, "type": "CREDITCARD", "balance": -1500.00}
-            }
-            credit_cards = ["Chase Freedom"]
+        accounts = {
+            "Chase Freedom": {"id": 1, "type": "CREDITCARD", "balance": -1500.00}
+        }
+        credit_cards = ["Chase Freedom"]
 
-            updates = updater.update_debts_sheet(ws, accounts, credit_cards)
+        updates = updater.update_debts_sheet(ws, accounts, credit_cards)
 
-            assert len(updates) == 0
+        assert len(updates) == 0
 
     def test_update_debts_empty_sheet(self, temp_db):
         """Test updating empty debts sheet."""
-        with patch("debt_optimizer.core.balance_updater.HAS_FUZZ", True):
-            updater = BalanceUpdater(temp_db)
+        updater = BalanceUpdater(temp_db)
 
-            wb = openpyxl.Workbook()
-            ws = wb.active
-            ws.append(["Account", "Balance"])
+        wb = openpyxl.Workbook()
+        ws = wb.active
+        ws.append(["Account", "Balance"])
 
-            accounts = {}
-            credit_cards = []
+        accounts = {}
+        credit_cards = []
 
-            updates = updater.update_debts_sheet(ws, accounts, credit_cards)
+        updates = updater.update_debts_sheet(ws, accounts, credit_cards)
 
-            assert len(updates) == 0
+        assert len(updates) == 0
 
-    def test_update_debts_no_credit_cards(self, temp_db, temp_xlsx):
+    def test_update_debts_no_credit_cards(self, temp_db, _xlsx_template_bytes):
         """Test updating debts with no credit cards."""
-        with patch("debt_optimizer.core.balance_updater.HAS_FUZZ", True):
-            updater = BalanceUpdater(temp_db)
+        updater = BalanceUpdater(temp_db)
 
-            wb = openpyxl.load_workbook(temp_xlsx)
-            ws = wb["Debts"]
+        # Pure read path, so the cheap streaming reader suffices
+        wb = openpyxl.load_workbook(
+            io.BytesIO(_xlsx_template_bytes), read_only=True, data_only=True
+        )
+        ws = wb["Debts"]
+        # Write-only saves omit the dimension record, so compute it
+        ws.calculate_dimension(force=True)
 
-            accounts = {}
-            credit_cards = []
+        accounts = {}
+        credit_cards = []
 
-            updates = updater.update_debts_sheet(ws, accounts, credit_cards)
+        updates = updater.update_debts_sheet(ws, accounts, credit_cards)
 
-            assert len(updates) == 0
+        assert len(updates) == 0
 
-    def test_update_debts_fuzzy_match_approved(self, temp_db, temp_xlsx):
+    def test_update_debts_fuzzy_match_approved(self, temp_db, template_wb, mock_extract):
         """Test fuzzy match with user approval."""
-        with patch("debt_optimizer.core.balance_updater.HAS_FUZZ", True):
-            with patch(
-                "debt_optimizer.core.balance_updater.process.extractOne"
-            ) as mock_extract:
-                mock_extract.return_value = ("Chase Freedom", 85, 0)
+        mock_extract.return_value = ("Chase Freedom", 85, 0)
 
-                updater = BalanceUpdater(temp_db)
+        updater = BalanceUpdater(temp_db)
 
-                wb = openpyxl.load_workbook(temp_xlsx)
-                ws = wb["Debts"]
-                # Clear existing data and add only one row
-                ws.delete_rows(2, ws.max_row)
-                ws.append(["Chase Card", 1000.00, 18.99, 25])
+        wb = template_wb
+        ws = wb["Debts"]
+        # Clear existing data and add only one row
+        ws.delete_rows(2, ws.max_row)
+        ws.append(["Chase Card", 1000.00, 18.99, 25])
 
-                accounts = {
-                    "Chase Freedom": {
-                        "id": 1,
-                        "type": "CREDITCARD",
-                        "balance": -1500.00,
-                    }
-                }
-                credit_cards = ["Chase Freedom"]
+        accounts = {
+            "Chase Freedom": {
+                "id": 1,
+                "type": "CREDITCARD",
+                "balance": -1500.00,
+            }
+        }
+        credit_cards = ["Chase Freedom"]
 
-                with patch.object(updater, "_prompt_yes_no", return_value=True):
-                    updates = updater.update_debts_sheet(ws, accounts, credit_cards)
+        with patch.object(updater, "_prompt_match_selection", return_value={1}):
+            updates = updater.update_debts_sheet(ws, accounts, credit_cards)
 
-                assert len(updates) == 1
-                assert updates[0]["auto"] is False
-                assert updates[0]["score"] == 85
-                assert ws.cell(row=2, column=1).value == "Chase Freedom"
+        assert len(updates) == 1
+        assert updates[0]["auto"] is False
+        assert updates[0]["score"] == 85
+        assert ws.cell(row=2, column=1).value == "Chase Freedom"
 
-    def test_update_debts_fuzzy_match_rejected(self, temp_db, temp_xlsx):
+    def test_update_debts_fuzzy_match_rejected(self, temp_db, template_wb, mock_extract):
         """Test fuzzy match with user rejection."""
-        with patch("debt_optimizer.core.balance_updater.HAS_FUZZ", True):
-            with patch(
-                "debt_optimizer.core.balance_updater.process.extractOne"
-            ) as mock_extract:
-                mock_extract.return_value = ("Chase Freedom", 85, 0)
+        mock_extract.return_value = ("Chase Freedom", 85, 0)
 
-                updater = BalanceUpdater(temp_db)
+        updater = BalanceUpdater(temp_db)
 
-                wb = openpyxl.load_workbook(temp_xlsx)
-                ws = wb["Debts"]
+        wb = template_wb
+        ws = wb["Debts"]
 
-                accounts = {
-                    "Chase Freedom": {
-                        "id": 1,
-                        "type": "CREDITCARD",
-                        "balance": -1500.00,
-                    }
-                }
-                credit_cards = ["Chase Freedom"]
+        accounts = {
+            "Chase Freedom": {
+                "id": 1,
+                "type": "CREDITCARD",
+                "balance": -1500.00,
+            }
+        }
+        credit_cards = ["Chase Freedom"]
 
-                with patch.object(updater, "_prompt_yes_no", return_value=False):
-                    updates = updater.update_debts_sheet(ws, accounts, credit_cards)
+        with patch.object(updater, "_prompt_match_selection", return_value=set()):
+            updates = updater.update_debts_sheet(ws, accounts, credit_cards)
 
-                assert len(updates) == 0
+        assert len(updates) == 0
 
-    def test_update_debts_score_too_low(self, temp_db, temp_xlsx):
+    def test_update_debts_score_too_low(self, temp_db, template_wb, mock_extract):
         """Test fuzzy match below threshold."""
-        with patch("debt_optimizer.core.balance_updater.HAS_FUZZ", True):
-            with patch(
-                "debt_optimizer.core.balance_updater.process.extractOne"
-            ) as mock_extract:
-                mock_extract.return_value = ("Chase Freedom", 50, 0)
+        mock_extract.return_value = ("Chase Freedom", 50, 0)
 
-                updater = BalanceUpdater(temp_db)
+        updater = BalanceUpdater(temp_db)
 
-                wb = openpyxl.load_workbook(temp_xlsx)
-                ws = wb["Debts"]
+        wb = template_wb
+        ws = wb["Debts"]
 
-                accounts = {
-                    "Chase Freedom": {
-                        "id": 1,
-                        "type": "CREDITCARD",
-                        "balance": -1500.00,
-                    }
-                }
-                credit_cards = ["Chase Freedom"]
+        accounts = {
+            "Chase Freedom": {
+                "id": 1,
+                "type": "CREDITCARD",
+                "balance": -1500.00,
+            }
+        }
+        credit_cards = ["Chase Freedom"]
 
-                updates = updater.update_debts_sheet(ws, accounts, credit_cards)
+        updates = updater.update_debts_sheet(ws, accounts, credit_cards)
 
-                assert len(updates) == 0
+        assert len(updates) == 0
 
-    def test_update_debts_rapidfuzz_format(self, temp_db, temp_xlsx):
+    def test_update_debts_rapidfuzz_format(self, temp_db, template_wb, mock_extract):
         """Test handling rapidfuzz 2-tuple return format."""
-        with patch("debt_optimizer.core.balance_updater.HAS_FUZZ", True):
-            with patch(
-                "debt_optimizer.core.balance_updater.process.extractOne"
-            ) as mock_extract:
-                # rapidfuzz returns 2-tuple
-                mock_extract.return_value = ("Chase Freedom", 85)
-
-                updater = BalanceUpdater(temp_db)
-
-                wb = openpyxl.load_workbook(temp_xlsx)
-                ws = wb["Debts"]
-                # Clear existing data and add only one row
-                ws.delete_rows(2, ws.max_row)
-                ws.append(["Chase Card", 1000.00, 18.99, 25])
-
-                accounts = {
-                    "Chase Freedom": {
-                        "id": 1,
-                        "type": "CREDITCARD",
-                        "balance": -1500.00,
-                    }
-                }
-                credit_cards = ["Chase Freedom"]
+        # rapidfuzz returns 2-tuple
+        mock_extract.return_value = ("Chase Freedom", 85)
+
+        updater = BalanceUpdater(temp_db)
+
+        wb = template_wb
+        ws = wb["Debts"]
+        # Clear existing data and add only one row
+        ws.delete_rows(2, ws.max_row)
+        ws.append(["Chase Card", 1000.00, 18.99, 25])
+
+        accounts = {
+            "Chase Freedom": {
+                "id": 1,
+                "type": "CREDITCARD",
+                "balance": -1500.00,
+            }
+        }
+        credit_cards = ["Chase Freedom"]
 
-                with patch.object(updater, "_prompt_yes_no", return_value=True):
-                    updates = updater.update_debts_sheet(ws, accounts, credit_cards)
+        with patch.object(updater, "_prompt_match_selection", return_value={1}):
+            updates = updater.update_debts_sheet(ws, accounts, credit_cards)
 
-                assert len(updates) == 1
+        assert len(updates) == 1
 
 
 class TestBalanceUpdaterUpdateSettings:
     """Test settings update functionality."""
 
-    def test_update_settings_exact_match(self, temp_db, temp_xlsx):
+    def test_update_settings_exact_match(self, temp_db, template_wb):
         """Test updating settings with exact match."""
-        with patch("debt_optimizer.core.balance_updater.HAS_FUZZ", True):
-            updater = BalanceUpdater(temp_db)
-
-            wb = openpyxl.load_workbook(temp_xlsx)
-            if "Settings" not in wb.sheetnames:
-                ws = wb.create_sheet("Settings")
-            else:
-                ws = wb["Settings"]
-            ws.cell(row=3, column=2).value = 4000.00
-
-            accounts = {
-                "PECU Checking": {"id": 1, "type": "CHECKING", "balance": 5000.00}
-            }
-            checking = ["PECU Checking"]
+        updater = BalanceUpdater(temp_db)
 
-            result = updater.update_settings_sheet(ws, accounts, checking)
+        wb = template_wb
+        if "Settings" not in wb.sheetnames:
+            ws = wb.create_sheet("Settings")
+        else:
+            ws = wb["Settings"]
+        ws.cell(row=3, column=2).value = 4000.00
 
-            assert result is not None
-            assert result["matched"] == "exact"
-            assert result["balance"] == 5000.00
-            assert ws.cell(row=3, column=2).value == 5000.00
+        accounts = {
+            "PECU Checking": {"id": 1, "type": "CHECKING", "balance": 5000.00}
+        }
+        checking = ["PECU Checking"]
 
-    def test_update_settings_no_change(self, temp_db, temp_xlsx):
-        """Test settings update when balance unchanged."""
-        with patch("debt_optimizer.core.balance_updater.HAS_FUZZ", True):
-            updater = BalanceUpdater(temp_db)
-
-            wb = openpyxl.load_workbook(temp_xlsx)
-            if "Settings" not in wb.sheetnames:
-                ws = wb.create_sheet("Settings")
-            else:
-                ws = wb["Settings"]
-            ws.cell(row=3, column=2).value = 5000.00
-
-            accounts = {
-                "PECU Checking": {"id": 1, "type": "CHECKING", "balance": 5000.00}
-            }
-            checking = ["PECU Checking"]
+        result = updater.update_settings_sheet(ws, accounts, checking)
 
-            result = updater.update_settings_sheet(ws, accounts, checking)
+        assert result is not None
+        assert result["matched"] == "exact"
+        assert result["balance"] == 5000.00
+        assert ws.cell(row=3, column=2).value == 5000.00
 
-            assert result is None
+    def test_update_settings_no_change(self, temp_db, template_wb):
+        """Test settings update when balance unchanged."""
+        updater = BalanceUpdater(temp_db)
 
-    def test_update_settings_fuzzy_match_approved(self, temp_db, temp_xlsx):
-        """Test fuzzy match in settings with approval."""
-        with patch("debt_optimizer.core.balance_updater.HAS_FUZZ", True):
-            with patch(
-                "debt_optimizer.core.balance_updater.process.extractOne"
-            ) as mock_extract:
-                mock_extract.return_value = ("PECU Checking Account", 90, 0)
+        wb = template_wb
+        if "Settings" not in wb.sheetnames:
+            ws = wb.create_sheet("Settings")
+        else:
+            ws = wb["Settings"]
+        ws.cell(row=3, column=2).value = 5000.00
 
-                updater = BalanceUpdater(temp_db, bank_account_name="PECU Check")
+        accounts = {
+            "PECU Checking": {"id": 1, "type": "CHECKING", "balance": 5000.00}
+        }
+        checking = ["PECU Checking"]
 
-                wb = openpyxl.load_workbook(temp_xlsx)
-                if "Settings" not in wb.sheetnames:
-                    ws = wb.create_sheet("Settings")
-                else:
-                    ws = wb["Settings"]
-                ws.cell(row=3, column=2).value = 4000.00
+        result = updater.update_settings_sheet(ws, accounts, checking)
 
-                accounts = {
-                    "PECU Checking Account": {
-                        "id": 1,
-                        "type": "CHECKING",
-                        "balance": 5000.00,
-                    }
-                }
-                checking = ["PECU Checking Account"]
+        assert result is None
 
-                with patch.object(updater, "_prompt_yes_no", return_value=True):
-                    result = updater.update_settings_sheet(ws, accounts, checking)
+    def test_update_settings_fuzzy_match_approved(self, temp_db, template_wb, mock_extract):
+        """Test fuzzy match in settings with approval."""
+        mock_extract.return_value = ("PECU Checking Account", 90, 0)
+
+        updater = BalanceUpdater(temp_db, bank_account_name="PECU Check")
+
+        wb = template_wb
+        if "Settings" not in wb.sheetnames:
+            ws = wb.create_sheet("Settings")
+        else:
+            ws = wb["Settings"]
+        ws.cell(row=3, column=2).value = 4000.00
+
+        accounts = {
+            "PECU Checking Account": {
+                "id": 1,
+                "type": "CHECKING",
+                "balance": 5000.00,
+            }
+        }
+        checking = ["PECU Checking Account"]
 
-                assert result is not None
-                assert "fuzzy" in result["matched"]
-                assert result["balance"] == 5000.00
+        with patch.object(updater, "_prompt_yes_no", return_value=True):
+            result = updater.update_settings_sheet(ws, accounts, checking)
 
-    def test_update_settings_fuzzy_match_rejected(self, temp_db, temp_xlsx):
+        assert result is not None
+        assert "fuzzy" in result["matched"]
+        assert result["balance"] == 5000.00
+
+    def test_update_settings_fuzzy_match_rejected(self, temp_db, template_wb, mock_extract):
         """Test fuzzy match in settings with rejection."""
-        with patch("debt_optimizer.core.balance_updater.HAS_FUZZ", True):
-            with patch(
-                "debt_optimizer.core.balance_updater.process.extractOne"
-            ) as mock_extract:
-                mock_extract.return_value = ("PECU Checking Account", 90, 0)
+        mock_extract.return_value = ("PECU Checking Account", 90, 0)
 
-                updater = BalanceUpdater(temp_db, bank_account_name="PECU Check")
+        updater = BalanceUpdater(temp_db, bank_account_name="PECU Check")
 
-                wb = openpyxl.load_workbook(temp_xlsx)
-                if "Settings" not in wb.sheetnames:
-                    ws = wb.create_sheet("Settings")
-                else:
-                    ws = wb["Settings"]
+        wb = template_wb
+        if "Settings" not in wb.sheetnames:
+            ws = wb.create_sheet("Settings")
+        else:
+            ws = wb["Settings"]
 
-                accounts = {
-                    "PECU Checking Account": {
-                        "id": 1,
-                        "type": "CHECKING",
-                        "balance": 5000.00,
-                    }
-                }
-                checking = ["PECU Checking Account"]
+        accounts = {
+            "PECU Checking Account": {
+                "id": 1,
+                "type": "CHECKING",
+                "balance": 5000.00,
+            }
+        }
+        checking = ["PECU Checking Account"]
 
-                with patch.object(updater, "_prompt_yes_no", return_value=False):
-                    result = updater.update_settings_sheet(ws, accounts, checking)
+        with patch.object(updater, "_prompt_yes_no", return_value=False):
+            result = updater.update_settings_sheet(ws, accounts, checking)
 
-                assert result is None
+        assert result is None
 
-    def test_update_settings_no_checking_accounts(self, temp_db, temp_xlsx):
+    def test_update_settings_no_checking_accounts(self, temp_db, template_wb):
         """Test settings update with no checking accounts."""
-        with patch("debt_optimizer.core.balance_updater.HAS_FUZZ", True):
-            updater = BalanceUpdater(temp_db)
+        updater = BalanceUpdater(temp_db)
 
-            wb = openpyxl.load_workbook(temp_xlsx)
-            if "Settings" not in wb.sheetnames:
-                ws = wb.create_sheet("Settings")
-            else:
-                ws = wb["Settings"]
+        wb = template_wb
+        if "Settings" not in wb.sheetnames:
+            ws = wb.create_sheet("Settings")
+        else:
+            ws = wb["Settings"]
 
-            accounts = {}
-            checking = []
+        accounts = {}
+        checking = []
 
-            result = updater.update_settings_sheet(ws, accounts, checking)
+        result = updater.update_settings_sheet(ws, accounts, checking)
 
-            assert result is None
+        assert result is None
 
 
 class TestBalanceUpdaterUpdateWorkbook:
     """Test full workbook update."""
 
-    def test_update_workbook_success(self, temp_db, temp_xlsx):
+    def test_update_workbook_success(self, temp_db, temp_xlsx, template_wb):
         """Test successful workbook update."""
-        with patch("debt_optimizer.core.balance_updater.HAS_FUZZ", True):
-            updater = BalanceUpdater(temp_db)
-
-            # Setup workbook
-            wb = openpyxl.load_workbook(temp_xlsx)
-            if "Settings" not in wb.sheetnames:
-                wb.create_sheet("Settings")
-            # Update debt to exact match to avoid prompts
-            ws = wb["Debts"]
-            ws.cell(row=2, column=1).value = "Chase Freedom"
-            wb.save(temp_xlsx)
-            wb.close()
-
-            with patch.object(updater, "load_quicken_balances") as mock_load:
-                mock_load.return_value = (
-                    {
-                        "Chase Freedom": {
-                            "id": 1,
-                            "type": "CREDITCARD",
-                            "balance": -1500.00,
-                        }
-                    },
-                    ["Chase Freedom"],
-                    [],
-                    [],
-                )
+        updater = BalanceUpdater(temp_db)
+
+        # Prepare the workbook in memory and hand it straight to
+        # update_workbook, skipping a save/reload round trip.
+        wb = template_wb
+        wb.create_sheet("Settings")
+        # Update debt to exact match to avoid prompts
+        ws = wb["Debts"]
+        ws.cell(row=2, column=1).value = "Chase Freedom"
+
+        with patch.object(updater, "load_quicken_balances") as mock_load:
+            mock_load.return_value = (
+                {
+                    "Chase Freedom": {
+                        "id": 1,
+                        "type": "CREDITCARD",
+                        "balance": -1500.00,
+                    }
+                },
+                ["Chase Freedom"],
+                [],
+                [],
+            )
 
+            with patch(
+                "debt_optimizer.core.balance_updater.openpyxl.load_workbook",
+                return_value=wb,
+            ):
                 result = updater.update_workbook(temp_xlsx, interactive=False)
 
-                assert result["workbook_path"] == temp_xlsx
-                assert result["backup_path"] is not None
-                assert isinstance(result["debt_updates"], list)
+            assert result["workbook_path"] == temp_xlsx
+            assert result["backup_path"] is not None
+            assert isinstance(result["debt_updates"], list)
 
     def test_update_workbook_file_not_found(self, temp_db):
         """Test workbook update with missing file."""
-        with patch("debt_optimizer.core.balance_updater.HAS_FUZZ", True):
-            updater = BalanceUpdater(temp_db)
+        updater = BalanceUpdater(temp_db)
 
-            with pytest.raises(FileNotFoundError, match="Excel workbook not found"):
-                updater.update_workbook(Path("/nonexistent/file.xlsx"))
+        with pytest.raises(FileNotFoundError, match="Excel workbook not found"):
+            updater.update_workbook(Path("/nonexistent/file.xlsx"))
 
     def test_update_workbook_no_debts_sheet(self, temp_db, temp_xlsx):
         """Test workbook update without Debts sheet."""
-        with patch("debt_optimizer.core.balance_updater.HAS_FUZZ", True):
-            updater = BalanceUpdater(temp_db)
+        updater = BalanceUpdater(temp_db)
 
-            # Create workbook without Debts sheet
-            wb = openpyxl.Workbook()
-            wb.save(temp_xlsx)
-            wb.close()
+        # Create workbook without Debts sheet; no need to hit disk
+        wb = openpyxl.Workbook()
 
-            with patch.object(updater, "load_quicken_balances") as mock_load:
-                mock_load.return_value = ({}, [], [], [])
+        with patch.object(updater, "load_quicken_balances") as mock_load:
+            mock_load.return_value = ({}, [], [], [])
 
+            with patch(
+                "debt_optimizer.core.balance_updater.openpyxl.load_workbook",
+                return_value=wb,
+            ):
                 with pytest.raises(
                     BalanceUpdaterError, match="'Debts' sheet not found"
                 ):
                     updater.update_workbook(temp_xlsx)
 
-    def test_update_workbook_no_backup(self, temp_db, temp_xlsx):
+    def test_update_workbook_no_backup(self, temp_db, temp_xlsx, template_wb):
         """Test workbook update without auto backup."""
-        with patch("debt_optimizer.core.balance_updater.HAS_FUZZ", True):
-            updater = BalanceUpdater(temp_db, auto_backup=False)
+        updater = BalanceUpdater(temp_db, auto_backup=False)
 
-            # Setup workbook
-            wb = openpyxl.load_workbook(temp_xlsx)
-            if "Settings" not in wb.sheetnames:
-                wb.create_sheet("Settings")
-            wb.save(temp_xlsx)
-            wb.close()
+        # Prepare the workbook in memory, skipping the save/reload cycle
+        wb = template_wb
+        wb.create_sheet("Settings")
 
-            with patch.object(updater, "load_quicken_balances") as mock_load:
-                mock_load.return_value = ({}, [], [], [])
+        with patch.object(updater, "load_quicken_balances") as mock_load:
+            mock_load.return_value = ({}, [], [], [])
 
+            with patch(
+                "debt_optimizer.core.balance_updater.openpyxl.load_workbook",
+                return_value=wb,
+            ):
                 result = updater.update_workbook(temp_xlsx)
 
-                assert result["backup_path"] is None
+            assert result["backup_path"] is None
 
 
 class TestBalanceUpdaterError:
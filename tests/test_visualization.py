@@ -5,50 +5,65 @@ Tests chart generation functionality and matplotlib integration for
 debt optimization visualizations.
 """
 
-import os
-import tempfile
+from datetime import date
 
-import matplotlib
+import matplotlib.pyplot as plt
 import pandas as pd
 import pytest
 
-matplotlib.use("Agg")  # Use non-interactive backend for testing
+# conftest.py selects the Agg backend and puts debt_optimizer on sys.path
+# before this module is imported, so neither is repeated here.
+from core.debt_optimizer import (
+    DebtOptimizer,
+    OptimizationGoal,
+)
+from core.financial_calc import Debt, Income, RecurringExpense
+from visualization.charts import DebtVisualization
 
-# Add debt_optimizer to Python path for testing
-import sys  # noqa: E402
-from pathlib import Path  # noqa: E402
 
-src_path = Path(__file__).parent.parent / "debt_optimizer"
-sys.path.insert(0, str(src_path))
+# Canned error-handling inputs, built once at import and never mutated
+INVALID_COLUMNS_DF = pd.DataFrame({"invalid_column": ["a", "b", "c"]})
+SMALL_PROGRESSION_DF = pd.DataFrame({"month": [1, 2, 3], "Debt": [1000, 800, 600]})
 
-from datetime import date  # noqa: E402
 
-import matplotlib.pyplot as plt  # noqa: E402
+@pytest.fixture(autouse=True)
+def _close_figs():
+    """Close any pyplot-registered figures once each test finishes.
 
-from core.debt_optimizer import (  # noqa: E402
-    DebtOptimizer,
-    OptimizationGoal,
-)
-from core.financial_calc import Debt, Income, RecurringExpense  # noqa: E402
-from visualization.charts import DebtVisualization  # noqa: E402
+    Runs even when an assertion fails, so no test needs its own
+    plt.close(fig) call and no figure survives into the next test.
+    """
+    yield
+    plt.close("all")
 
 
 class TestDebtVisualization:
     """Test cases for the DebtVisualization class."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.viz = DebtVisualization()
+    # Smoke tests over canned frames; run them alone with -m quick
+    pytestmark = [pytest.mark.quick]
+
+    @pytest.fixture(scope="class")
+    @staticmethod
+    def viz():
+        """Shared DebtVisualization instance; tests never mutate it."""
+        return DebtVisualization()
 
-        # Sample debts
-        self.debts = [
+    @pytest.fixture(scope="class")
+    @staticmethod
+    def debts():
+        """Sample debts, built once per class."""
+        return [
             Debt("Credit Card", 5000.0, 150.0, 18.99, 15),
             Debt("Auto Loan", 12000.0, 325.0, 4.5, 10),
             Debt("Personal Loan", 3000.0, 100.0, 12.0, 25),
         ]
 
-        # Sample debt progression data
-        self.debt_progression = pd.DataFrame(
+    @pytest.fixture(scope="class")
+    @staticmethod
+    def debt_progression():
+        """Sample debt progression data, built once per class."""
+        return pd.DataFrame(
             {
                 "month": [1, 2, 3, 4, 5, 6],
                 "Credit Card": [5000.0, 4800.0, 4600.0, 4400.0, 4200.0, 4000.0],
@@ -57,8 +72,11 @@ class TestDebtVisualization:
             }
         )
 
-        # Sample monthly summary data
-        self.monthly_summary = pd.DataFrame(
+    @pytest.fixture(scope="class")
+    @staticmethod
+    def monthly_summary():
+        """Sample monthly summary data, built once per class."""
+        return pd.DataFrame(
             {
                 "month": [1, 2, 3, 4, 5],
                 "total_principal": [350.0, 355.0, 360.0, 365.0, 370.0],
@@ -66,8 +84,11 @@ class TestDebtVisualization:
             }
         )
 
-        # Sample comparison data
-        self.comparison_df = pd.DataFrame(
+    @pytest.fixture(scope="class")
+    @staticmethod
+    def comparison_df():
+        """Sample strategy comparison data, built once per class."""
+        return pd.DataFrame(
             {
                 "strategy": ["debt_avalanche", "debt_snowball", "hybrid"],
                 "total_interest": [5000.0, 5500.0, 5250.0],
@@ -86,137 +107,140 @@ class TestDebtVisualization:
         assert len(viz.colors) > 0
 
     @pytest.mark.visualization
-    def test_plot_debt_progression_basic(self):
+    def test_plot_debt_progression_basic(self, viz, debt_progression):
         """Test basic debt progression chart creation."""
-        fig = self.viz.plot_debt_progression(self.debt_progression)
+        fig = viz.plot_debt_progression(debt_progression)
 
         assert fig is not None
         assert len(fig.axes) > 0
         ax = fig.axes[0]
-        assert len(ax.get_lines()) > 0  # Should have line plots
-        plt.close(fig)
+        assert len(ax.lines) > 0  # Should have line plots
 
     @pytest.mark.visualization
-    def test_plot_debt_progression_with_save(self):
+    def test_plot_debt_progression_with_save(self, viz, debt_progression, tmp_path):
         """Test debt progression chart with save functionality."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            save_path = os.path.join(temp_dir, "debt_progression.png")
-            fig = self.viz.plot_debt_progression(
-                self.debt_progression, save_path=save_path
-            )
+        save_path = tmp_path / "debt_progression.png"
+        # Only file existence is asserted; a low dpi keeps the
+        # rasterization cheap without changing what is verified.
+        fig = viz.plot_debt_progression(
+            debt_progression, save_path=str(save_path), dpi=50
+        )
 
-            assert fig is not None
-            assert os.path.exists(save_path)
-            plt.close(fig)
+        assert fig is not None
+        assert save_path.exists()
 
     @pytest.mark.visualization
-    def test_plot_payment_breakdown(self):
+    def test_plot_payment_breakdown(self, viz, monthly_summary):
         """Test payment breakdown chart creation."""
-        fig = self.viz.plot_payment_breakdown(self.monthly_summary)
+        fig = viz.plot_payment_breakdown(monthly_summary)
 
         assert fig is not None
         assert len(fig.axes) > 0
         ax = fig.axes[0]
         assert len(ax.patches) > 0  # Should have bars
-        plt.close(fig)
 
     @pytest.mark.visualization
-    def test_plot_strategy_comparison(self):
+    def test_plot_strategy_comparison(self, viz, comparison_df):
         """Test strategy comparison chart creation."""
-        fig = self.viz.plot_strategy_comparison(self.comparison_df)
+        fig = viz.plot_strategy_comparison(comparison_df)
 
         assert fig is not None
         assert len(fig.axes) >= 4  # Should have 4 subplots (2x2 grid)
-        plt.close(fig)
-
-    @pytest.mark.visualization
-    def test_plot_debt_composition(self):
-        """Test debt composition pie chart creation."""
-        fig = self.viz.plot_debt_composition(self.debts)
-
-        assert fig is not None
-        assert len(fig.axes) > 0
-        ax = fig.axes[0]
-        assert len(ax.patches) > 0  # Should have pie wedges
-        plt.close(fig)
 
     @pytest.mark.visualization
-    def test_plot_interest_rate_comparison(self):
-        """Test interest rate comparison chart creation."""
-        fig = self.viz.plot_interest_rate_comparison(self.debts)
+    @pytest.mark.parametrize(
+        "chart_method",
+        ["plot_debt_composition", "plot_interest_rate_comparison"],
+    )
+    def test_plot_debt_chart(self, viz, debts, chart_method):
+        """Test per-debt chart creation (pie wedges / horizontal bars)."""
+        fig = getattr(viz, chart_method)(debts)
 
         assert fig is not None
         assert len(fig.axes) > 0
         ax = fig.axes[0]
-        assert len(ax.patches) > 0  # Should have horizontal bars
-        plt.close(fig)
+        assert len(ax.patches) > 0  # Should have wedges or bars
 
     @pytest.mark.visualization
-    def test_empty_data_handling(self):
+    def test_empty_data_handling(self, viz):
         """Test chart handling with empty data."""
         empty_progression = pd.DataFrame(columns=["month"])
 
         # Should handle empty data gracefully
-        fig = self.viz.plot_debt_progression(empty_progression)
+        fig = viz.plot_debt_progression(empty_progression)
         assert fig is not None
-        plt.close(fig)
 
     @pytest.mark.visualization
-    def test_single_debt_handling(self):
+    @pytest.mark.parametrize(
+        "chart_method",
+        ["plot_debt_composition", "plot_interest_rate_comparison"],
+    )
+    def test_single_debt_handling(self, viz, debts, chart_method):
         """Test charts with single debt."""
-        single_debt = [self.debts[0]]
+        single_debt = [debts[0]]
 
-        fig = self.viz.plot_debt_composition(single_debt)
+        fig = getattr(viz, chart_method)(single_debt)
         assert fig is not None
-        plt.close(fig)
-
-        fig = self.viz.plot_interest_rate_comparison(single_debt)
-        assert fig is not None
-        plt.close(fig)
 
     @pytest.mark.visualization
-    def test_custom_figsize(self):
+    def test_custom_figsize(self, viz, debt_progression):
         """Test charts with custom figure sizes."""
         custom_size = (10, 6)
-        fig = self.viz.plot_debt_progression(self.debt_progression, figsize=custom_size)
+        fig = viz.plot_debt_progression(debt_progression, figsize=custom_size)
 
         assert fig.get_figwidth() == custom_size[0]
         assert fig.get_figheight() == custom_size[1]
-        plt.close(fig)
 
 
 class TestVisualizationIntegration:
     """Integration tests for visualization with real optimization data."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.debts = [
+    @pytest.fixture(scope="class")
+    @staticmethod
+    def debts():
+        """Sample debts for optimization runs, built once per class."""
+        return [
             Debt("Credit Card", 5000.0, 150.0, 18.99, 15),
             Debt("Auto Loan", 15000.0, 350.0, 5.5, 10),
         ]
 
-        self.income = [Income("Salary", 3500.0, "bi-weekly", date(2024, 1, 5))]
-
-        self.expenses = [
+    @pytest.fixture(scope="class")
+    @staticmethod
+    def income():
+        """Sample income, built once per class."""
+        return [Income("Salary", 3500.0, "bi-weekly", date(2024, 1, 5))]
+
+    @pytest.fixture(scope="class")
+    @staticmethod
+    def expenses():
+        """Sample recurring expenses, built once per class."""
+        return [
             RecurringExpense("Rent", 1200.0, "monthly", 1, date(2024, 1, 1)),
             RecurringExpense("Utilities", 200.0, "monthly", 15, date(2024, 1, 1)),
         ]
 
-    @pytest.mark.integration
-    @pytest.mark.visualization
-    def test_visualization_with_optimization_result(self):
-        """Test visualization with real optimization data."""
-        optimizer = DebtOptimizer(self.debts, self.income, self.expenses)
+    @pytest.fixture(scope="class")
+    @staticmethod
+    def optimization_result(debts, income, expenses):
+        """Run the optimization once per class; both tests read the result."""
+        optimizer = DebtOptimizer(debts, income, expenses)
         result = optimizer.optimize_debt_strategy(
             OptimizationGoal.MINIMIZE_INTEREST, 200.0
         )
+        return result
+
+    @pytest.mark.integration
+    @pytest.mark.visualization
+    def test_visualization_with_optimization_result(self, debts, optimization_result):
+        """Test visualization with real optimization data."""
+        result = optimization_result
 
         viz = DebtVisualization()
 
         # Test with real payment schedule data
         if hasattr(result, "payment_schedule") and len(result.payment_schedule) > 0:
             # Create debt progression from payment schedule
-            debt_names = [debt.name for debt in self.debts]
+            debt_names = [debt.name for debt in debts]
             progression_data = pd.DataFrame()
             progression_data["month"] = range(
                 1, min(13, len(result.payment_schedule) + 1)
@@ -229,61 +253,51 @@ class TestVisualizationIntegration:
 
             fig = viz.plot_debt_progression(progression_data)
             assert fig is not None
-            plt.close(fig)
 
     @pytest.mark.integration
     @pytest.mark.visualization
-    def test_dashboard_creation(self):
+    def test_dashboard_creation(self, debts, optimization_result):
         """Test creating a comprehensive dashboard."""
-        optimizer = DebtOptimizer(self.debts, self.income, self.expenses)
-        result = optimizer.optimize_debt_strategy(
-            OptimizationGoal.MINIMIZE_INTEREST, 200.0
-        )
+        result = optimization_result
 
         viz = DebtVisualization()
 
         # Test dashboard creation
-        fig = viz.create_dashboard(result, self.debts)
+        fig = viz.create_dashboard(result, debts)
         assert fig is not None
         assert len(fig.axes) > 0
-        plt.close(fig)
 
 
 class TestVisualizationErrorHandling:
     """Test error handling in visualization."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.viz = DebtVisualization()
+    pytestmark = [pytest.mark.quick]
+
+    @pytest.fixture(scope="class")
+    @staticmethod
+    def viz():
+        """Shared DebtVisualization instance for error handling tests."""
+        return DebtVisualization()
 
     @pytest.mark.visualization
-    def test_invalid_data_handling(self):
+    def test_invalid_data_handling(self, viz):
         """Test handling of invalid data."""
-        # Test with completely invalid data
-        invalid_data = pd.DataFrame({"invalid_column": ["a", "b", "c"]})
-
         # Should handle gracefully or raise appropriate exception
         try:
-            fig = self.viz.plot_debt_progression(invalid_data)
-            if fig:
-                plt.close(fig)
+            viz.plot_debt_progression(INVALID_COLUMNS_DF)
         except (KeyError, ValueError, IndexError):
             # Expected for invalid data
             pass
 
     @pytest.mark.visualization
-    def test_memory_cleanup(self):
+    @pytest.mark.xdist_group(name="visualization_gc")
+    def test_memory_cleanup(self, viz):
         """Test that visualization doesn't cause memory leaks."""
         import gc
 
-        # Create multiple charts
-        for i in range(5):
-            debt_progression = pd.DataFrame(
-                {"month": [1, 2, 3], f"Debt_{i}": [1000, 800, 600]}
-            )
-
-            fig = self.viz.plot_debt_progression(debt_progression)
-            plt.close(fig)
+        # Only the chart creation needs repeating; the input is canned
+        for _ in range(5):
+            viz.plot_debt_progression(SMALL_PROGRESSION_DF)
 
         # Force garbage collection
         gc.collect()